@@ -2,91 +2,43 @@
 FastAPI application exposing the local XTTS engine.
 
 Minimal HTTP API that wires POST /tts → EngineManager.synthesize()
+(see api/tts.py) plus the health endpoints. This is the single application
+served by uvicorn (api.app:app).
 """
 
-import os
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 # Add parent directory to path to allow imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse
-from pydantic import BaseModel, Field
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
-from core.engine_manager import EngineManager
-from core.errors import SynthesisError, EngineLoadError, TTSError
-
-# Initialize FastAPI app
-app = FastAPI(title="Vox Navigator TTS Server")
-
-# Shared EngineManager instance (singleton)
-_engine_manager: EngineManager = None
-
-
-def get_engine_manager() -> EngineManager:
-    """Get or create the shared EngineManager instance."""
-    global _engine_manager
-    if _engine_manager is None:
-        _engine_manager = EngineManager()
-    return _engine_manager
+import config
+from api.tts import router as tts_router, tts_semaphore
+from core.engine_manager import engine_manager
 
 
-# Request model
-class TTSRequest(BaseModel):
-    """Request body for TTS synthesis."""
-    text: str = Field(..., min_length=1)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the request-pooling batch worker for the lifetime of the app."""
+    await engine_manager.start_batching(slots=tts_semaphore)
+    try:
+        yield
+    finally:
+        await engine_manager.stop_batching()
 
 
-@app.post("/tts", response_class=FileResponse)
-def synthesize_tts(request: TTSRequest) -> FileResponse:
-    """
-    POST /tts - Synthesize speech from text.
-    
-    Input: JSON { "text": "<string>" }
-    Output: WAV file as audio/wav
-    
-    Returns HTTP 400 if text is missing/empty.
-    Returns HTTP 500 if synthesis fails.
-    """
-    # Validate input: non-empty text
-    text = request.text.strip()
-    if not text:
-        raise HTTPException(status_code=400, detail="Text cannot be empty")
-    
-    # Get shared EngineManager instance
-    engine_manager = get_engine_manager()
-    
-    # Call EngineManager.synthesize() - this handles all TTS logic
-    try:
-        audio_path = engine_manager.synthesize(text=text)
-        
-        # Verify file was created
-        if not os.path.exists(audio_path):
-            raise HTTPException(
-                status_code=500,
-                detail=f"Audio file was not created: {audio_path}"
-            )
-        
-        # Return WAV file as audio/wav
-        return FileResponse(
-            path=audio_path,
-            media_type="audio/wav",
-            filename=os.path.basename(audio_path)
-        )
-        
-    except SynthesisError as e:
-        raise HTTPException(status_code=500, detail=f"TTS synthesis failed: {str(e)}") from e
-    except EngineLoadError as e:
-        raise HTTPException(status_code=500, detail=f"TTS engine failed to load: {str(e)}") from e
-    except TTSError as e:
-        raise HTTPException(status_code=500, detail=f"TTS error: {str(e)}") from e
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Unexpected error: {type(e).__name__}: {e}"
-        ) from e
+# Initialize FastAPI app
+# JSON bodies (health checks polled by load balancers) are encoded with orjson
+app = FastAPI(
+    title="Vox Navigator TTS Server",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
+app.include_router(tts_router)
 
 
 @app.get("/")
@@ -104,7 +56,6 @@ def health():
         dict: Health status and engine initialization state
     """
     try:
-        engine_manager = get_engine_manager()
         is_initialized = engine_manager.is_initialized()
         device_info = engine_manager.get_current_device()
         
@@ -129,16 +80,23 @@ if __name__ == "__main__":
         python api/app.py
         
     Or with uvicorn directly:
-        uvicorn api.app:app --host 127.0.0.1 --port 8000
+        uvicorn api.app:app --host 127.0.0.1 --port 8000 --loop uvloop --http httptools
     """
     import uvicorn
     
     # Bind to localhost only (127.0.0.1)
     # Port 8000 is the default FastAPI port
+    # uvloop and httptools (both part of uvicorn[standard]) replace the
+    # asyncio loop and h11 parser for lower per-request overhead.
+    # Each worker is a separate process holding its own XTTS model in VRAM:
+    # keep TTS_WORKERS at 1 unless every worker has its own GPU.
     uvicorn.run(
         "api.app:app",
         host="0.0.0.0",
         port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=config.TTS_WORKERS,
         reload=False,  # Disable auto-reload for production-like behavior
         log_level="info"
     )
@@ -4,23 +4,199 @@ TTS API endpoints.
 Handles:
 - Text-to-speech request processing
 - Input validation
-- Response formatting
+- Response formatting (streamed or buffered WAV)
 """
 
-from fastapi import APIRouter
+import asyncio
+import os
+from typing import AsyncIterator, Iterator, Optional
 
-router = APIRouter(prefix="/api/tts", tags=["tts"])
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field, field_validator
 
-@router.post("/synthesize")
-def synthesize(text: str):
+import config
+from core.engine_manager import engine_manager
+from core.errors import SynthesisError, EngineLoadError, TTSError
+
+router = APIRouter(tags=["tts"])
+
+# Bounds how many syntheses share the GPU at once; extra requests wait here
+# instead of thrashing device memory
+tts_semaphore = asyncio.Semaphore(config.TTS_CONCURRENT_REQUESTS)
+
+
+# Request model
+class TTSRequest(BaseModel):
+    """Request body for TTS synthesis."""
+    text: str = Field(..., min_length=1)
+    
+    @field_validator("text")
+    @classmethod
+    def _strip_text(cls, value: str) -> str:
+        """Strip surrounding whitespace and reject blank text."""
+        value = value.strip()
+        if not value:
+            raise ValueError("Text cannot be empty")
+        return value
+
+
+def _wants_buffered(accept: Optional[str]) -> bool:
+    """Check whether the client asked for a complete file instead of a stream."""
+    return bool(accept) and "buffered=1" in accept.replace(" ", "")
+
+
+def _file_response(audio_path: str) -> FileResponse:
+    """Build the WAV file response for a synthesized audio file."""
+    # Verify file was created
+    if not os.path.exists(audio_path):
+        raise HTTPException(
+            status_code=500,
+            detail=f"Audio file was not created: {audio_path}"
+        )
+    
+    # Return WAV file as audio/wav
+    return FileResponse(
+        path=audio_path,
+        media_type="audio/wav",
+        filename=os.path.basename(audio_path)
+    )
+
+
+class _StreamSlot:
     """
-    Synthesize speech from text.
+    A tts_semaphore slot held by a streamed response, released exactly once.
     
-    Args:
-        text: Input text to synthesize
-        
-    Returns:
-        Audio data in WAV format
+    Both the body generator and the response itself release it when they
+    finish, so the slot comes back whether or not the body ever started
+    (e.g. when sending the response headers fails).
+    """
+    
+    def __init__(self, stream: Iterator[bytes]):
+        self._stream = stream
+        self._held = True
+    
+    def release(self) -> None:
+        """Close the synthesis stream and give the slot back (idempotent)."""
+        if not self._held:
+            return
+        self._held = False
+        try:
+            self._stream.close()
+        except ValueError:
+            # Still running in a worker thread (client went away mid-chunk)
+            pass
+        finally:
+            tts_semaphore.release()
+
+
+class _SlotStreamingResponse(StreamingResponse):
+    """StreamingResponse that releases its semaphore slot when it is done."""
+    
+    def __init__(self, content, slot: _StreamSlot, **kwargs):
+        super().__init__(content, **kwargs)
+        self._slot = slot
+    
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self._slot.release()
+
+
+async def _stream_wav(
+    stream: Iterator[bytes],
+    first_chunk: bytes,
+    slot: _StreamSlot
+) -> AsyncIterator[bytes]:
+    """
+    Relay a synthesis stream to the client, releasing the GPU slot at the end.
+    
+    Each chunk is pulled in a worker thread so inference never blocks the
+    event loop.
+    """
+    try:
+        yield first_chunk
+        while True:
+            chunk = await asyncio.to_thread(next, stream, None)
+            if chunk is None:
+                break
+            yield chunk
+    finally:
+        slot.release()
+
+
+@router.post("/tts")
+async def synthesize_tts(
+    request: TTSRequest,
+    accept: Optional[str] = Header(default=None)
+) -> Response:
     """
-    # Placeholder implementation
-    return {"status": "not_implemented"}
+    POST /tts - Synthesize speech from text.
+    
+    Input: JSON { "text": "<string>" }
+    Output: WAV audio as audio/wav
+    
+    Audio is streamed while it is being synthesized. Previously synthesized
+    text, engines without streaming support and clients sending
+    "Accept: audio/wav; buffered=1" receive the complete file instead.
+    
+    At most TTS_CONCURRENT_REQUESTS syntheses run at the same time; the
+    blocking engine calls run in worker threads.
+    
+    Returns HTTP 422 if text is missing/empty (validated by TTSRequest).
+    Returns HTTP 500 if synthesis fails.
+    """
+    text = request.text
+    
+    # Call EngineManager - this handles all TTS logic
+    try:
+        # Run off the event loop: the first lookup creates the engine and
+        # opens the cache directory, which would stall every other request
+        cached_path = None
+        if not _wants_buffered(accept):
+            cached_path = await asyncio.to_thread(engine_manager.get_cached, text)
+        if cached_path is not None:
+            return _file_response(cached_path)
+        
+        if _wants_buffered(accept):
+            # Pooled with concurrent requests by the batch worker
+            return _file_response(await engine_manager.asynthesize(text))
+        
+        await tts_semaphore.acquire()
+        handed_off = False
+        try:
+            stream = engine_manager.synthesize_stream(text=text)
+            try:
+                # Start synthesis here so failures still map to HTTP errors
+                first_chunk = await asyncio.to_thread(next, stream)
+            except NotImplementedError:
+                audio_path = await asyncio.to_thread(engine_manager.synthesize, text)
+                return _file_response(audio_path)
+            
+            # The response now owns the semaphore slot
+            slot = _StreamSlot(stream)
+            response = _SlotStreamingResponse(
+                _stream_wav(stream, first_chunk, slot),
+                slot=slot,
+                media_type="audio/wav"
+            )
+            handed_off = True
+            return response
+        finally:
+            if not handed_off:
+                tts_semaphore.release()
+        
+    except HTTPException:
+        raise
+    except SynthesisError as e:
+        raise HTTPException(status_code=500, detail=f"TTS synthesis failed: {str(e)}") from e
+    except EngineLoadError as e:
+        raise HTTPException(status_code=500, detail=f"TTS engine failed to load: {str(e)}") from e
+    except TTSError as e:
+        raise HTTPException(status_code=500, detail=f"TTS error: {str(e)}") from e
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Unexpected error: {type(e).__name__}: {e}"
+        ) from e
@@ -23,9 +23,11 @@ Default audio characteristics:
 """
 
 import os
+import struct
 import tempfile
-import wave
-from typing import Union, Optional, List
+from typing import Set, Union, Optional, List
+
+import numpy as np
 
 from core.errors import TTSError
 
@@ -40,12 +42,41 @@ DEFAULT_SAMPLE_RATE = 22050  # Hz
 DEFAULT_CHANNELS = 1  # Mono
 DEFAULT_SAMPLE_WIDTH = 2  # 16-bit (2 bytes per sample)
 
+# Output directories already created by this process
+_ensured_dirs: Set[str] = set()
+
+
+def resolve_output_path(output_path: str) -> str:
+    """
+    Make an output path absolute and ensure its directory exists.
+    
+    Directories are only created once per process, and paths that are
+    already absolute are used as-is, so writing repeatedly into the same
+    directory costs no extra syscalls.
+    
+    Args:
+        output_path: Path where a file is about to be written
+    
+    Returns:
+        str: Absolute path to write to
+    """
+    if not os.path.isabs(output_path):
+        output_path = os.path.abspath(output_path)
+    
+    output_dir = os.path.dirname(output_path)
+    if output_dir not in _ensured_dirs:
+        os.makedirs(output_dir, exist_ok=True)
+        _ensured_dirs.add(output_dir)
+    
+    return output_path
+
 
 def write_wav(
-    audio_data: Union[List[float], List[int], 'numpy.ndarray'],
+    audio_data: Union[List[float], List[int], 'np.ndarray'],
     output_path: Optional[str] = None,
     sample_rate: int = DEFAULT_SAMPLE_RATE,
-    channels: int = DEFAULT_CHANNELS
+    channels: int = DEFAULT_CHANNELS,
+    scratch: Optional['np.ndarray'] = None
 ) -> str:
     """
     Write audio waveform data to a WAV file.
@@ -58,13 +89,17 @@ def write_wav(
         audio_data: Audio samples as:
                    - List of floats (normalized to [-1.0, 1.0])
                    - List of integers (16-bit range: -32768 to 32767)
-                   - NumPy array (will be converted to list)
+                   - NumPy array (float or integer dtype, used as-is;
+                     int16 arrays are taken as ready-made PCM and written
+                     without any conversion)
         output_path: Optional path where the WAV file should be written.
                      If None, a temporary file is created in the system temp
                      directory with a unique name.
         sample_rate: Sample rate in Hz. Default is 22050 Hz.
         channels: Number of audio channels. Default is 1 (mono).
                  Must be 1 or 2 (stereo).
+        scratch: Optional preallocated little-endian int16 buffer reused for
+                 the PCM conversion. Callers must not use it concurrently.
     
     Returns:
         str: Absolute filesystem path to the written WAV file.
@@ -81,7 +116,7 @@ def write_wav(
         - The output file is always overwritten if it exists
         - If writing fails, any partial file is cleaned up
         - The function validates audio data before writing
-        - NumPy arrays are automatically converted to lists
+        - NumPy arrays are converted without an intermediate Python list
     """
     # Validate parameters
     if sample_rate <= 0:
@@ -90,39 +125,38 @@ def write_wav(
     if channels not in (1, 2):
         raise AudioWriteError(f"Unsupported channel count: {channels} (must be 1 or 2)")
     
-    if not audio_data:
-        raise AudioWriteError("Audio data cannot be empty")
-    
-    # Convert numpy array to list if needed
-    try:
-        import numpy as np
-        if isinstance(audio_data, np.ndarray):
-            audio_data = audio_data.tolist()
-    except ImportError:
-        # NumPy not available, assume it's already a list
-        pass
-    
-    # Validate audio data type
-    if not isinstance(audio_data, (list, tuple)):
+    # Validate audio data type and bring lists/tuples into a single
+    # contiguous array; NumPy arrays are passed through untouched
+    if isinstance(audio_data, (list, tuple)):
+        if not audio_data:
+            raise AudioWriteError("Audio data cannot be empty")
+        try:
+            # Let NumPy pick the dtype from all samples (mixed int/float lists
+            # become float, NumPy scalars keep their kind); _audio_to_pcm()
+            # branches on dtype.kind like for arrays
+            audio_data = np.asarray(audio_data)
+        except (TypeError, ValueError, OverflowError) as e:
+            raise AudioWriteError(f"Invalid audio samples: {e}") from e
+    elif not isinstance(audio_data, np.ndarray):
         raise AudioWriteError(
             f"Audio data must be a list, tuple, or numpy array, got {type(audio_data)}"
         )
     
+    if audio_data.size == 0:
+        raise AudioWriteError("Audio data cannot be empty")
+    
     # Determine output path
     if output_path is None:
         # Create temporary file
         fd, output_path = tempfile.mkstemp(suffix='.wav', prefix='tts_')
-        os.close(fd)  # Close file descriptor, we'll open it with wave module
+        os.close(fd)  # Close file descriptor, it is reopened for the WAV write
     else:
         # Ensure output directory exists
-        output_dir = os.path.dirname(os.path.abspath(output_path))
-        if output_dir:
-            os.makedirs(output_dir, exist_ok=True)
-        output_path = os.path.abspath(output_path)
+        output_path = resolve_output_path(output_path)
     
-    # Convert audio data to 16-bit PCM bytes
+    # Convert audio data to 16-bit PCM
     try:
-        pcm_bytes = _audio_to_pcm_bytes(audio_data)
+        pcm = _audio_to_pcm(audio_data, out=scratch)
     except Exception as e:
         raise AudioWriteError(f"Failed to convert audio data to PCM: {e}") from e
     
@@ -130,11 +164,13 @@ def write_wav(
     try:
         _write_wav_file(
             output_path=output_path,
-            pcm_data=pcm_bytes,
+            pcm_data=pcm,
             sample_rate=sample_rate,
             channels=channels
         )
     except Exception as e:
+        # The directory may have been removed since it was created
+        _ensured_dirs.discard(os.path.dirname(output_path))
         # Clean up partial file on error
         if os.path.exists(output_path):
             try:
@@ -143,74 +179,154 @@ def write_wav(
                 pass
         raise AudioWriteError(f"Failed to write WAV file to {output_path}: {e}") from e
     
-    # Verify file was written successfully
-    if not os.path.exists(output_path):
+    # Verify file was written successfully (a single stat for both checks)
+    try:
+        file_size = os.stat(output_path).st_size
+    except FileNotFoundError:
         raise AudioWriteError(f"WAV file was not created at {output_path}")
     
-    if os.path.getsize(output_path) == 0:
+    if file_size == 0:
         os.remove(output_path)
         raise AudioWriteError(f"WAV file is empty at {output_path}")
     
     return output_path
 
 
-def _audio_to_pcm_bytes(audio_data: List[Union[float, int]]) -> bytes:
+def _audio_to_pcm(
+    audio_data: np.ndarray,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
     """
-    Convert audio samples to 16-bit PCM bytes.
+    Convert audio samples to 16-bit PCM.
     
     Handles both normalized float arrays ([-1.0, 1.0]) and integer arrays
-    (16-bit range: -32768 to 32767).
+    (16-bit range: -32768 to 32767). The conversion is fully vectorized with
+    NumPy, so no per-sample Python work is done. Little-endian int16 input
+    already is PCM and is returned without a conversion pass.
     
     Args:
-        audio_data: List of audio samples (floats or integers)
+        audio_data: Audio samples array (float or integer dtype)
+        out: Optional little-endian int16 buffer to convert into. It is used
+             when it can hold all samples, avoiding a fresh allocation.
     
     Returns:
-        bytes: 16-bit PCM audio data (little-endian)
+        np.ndarray: 16-bit little-endian PCM samples (a view of ``out``
+                    when it was used, or of the input when it already was
+                    int16 PCM)
     
     Raises:
         AudioWriteError: If conversion fails
     """
-    pcm_samples = []
-    
-    for sample in audio_data:
-        # Handle float samples (normalized to [-1.0, 1.0])
-        if isinstance(sample, float):
-            # Clamp to valid range
-            sample = max(-1.0, min(1.0, sample))
-            # Convert to 16-bit integer
-            pcm_sample = int(sample * 32767)
-        # Handle integer samples (assumed to be in 16-bit range)
-        elif isinstance(sample, int):
-            # Clamp to 16-bit range
-            pcm_sample = max(-32768, min(32767, sample))
-        else:
-            raise AudioWriteError(
-                f"Invalid sample type: {type(sample)} (must be float or int)"
-            )
-        
-        pcm_samples.append(pcm_sample)
-    
-    # Convert to bytes (little-endian, 16-bit signed integers)
-    pcm_bytes = b''.join(
-        pcm_sample.to_bytes(2, byteorder='little', signed=True)
-        for pcm_sample in pcm_samples
+    arr = np.asarray(audio_data).reshape(-1)
+    
+    if arr.dtype == np.dtype('<i2'):
+        return np.ascontiguousarray(arr)
+    
+    if out is not None and out.size >= arr.size:
+        out = out[:arr.size]
+    else:
+        out = np.empty(arr.size, dtype='<i2')
+    
+    if arr.dtype.kind == 'f':
+        # Clamp to valid range (new array, the caller's buffer is left intact);
+        # half precision can't represent 32767, so it is scaled in float32
+        arr = np.clip(arr, -1.0, 1.0, dtype=np.float32 if arr.itemsize < 4 else None)
+        # Scale to 16-bit range; the cast truncates towards zero like int()
+        np.multiply(arr, 32767.0, out=out, casting='unsafe')
+    elif arr.dtype.kind in ('i', 'u'):
+        # Clamp to 16-bit range
+        np.clip(arr, -32768, 32767, out=out, casting='unsafe')
+    else:
+        raise AudioWriteError(
+            f"Invalid sample type: {arr.dtype} (must be float or int)"
+        )
+    
+    return out
+
+
+def wav_header(data_size: Optional[int], sample_rate: int, channels: int) -> bytes:
+    """
+    Build the 44-byte RIFF/WAVE header for 16-bit PCM audio.
+    
+    Args:
+        data_size: Size of the PCM payload in bytes, or None when the length
+                   is not known up front (streamed audio). In that case the
+                   size fields are set to 0xFFFFFFFF, which players treat
+                   as "read until end of stream".
+        sample_rate: Sample rate in Hz
+        channels: Number of audio channels (1 or 2)
+    
+    Returns:
+        bytes: Canonical WAV header (RIFF, fmt and data chunk headers)
+    """
+    if data_size is None:
+        riff_size = data_size = 0xFFFFFFFF
+    else:
+        riff_size = 36 + data_size
+    
+    block_align = channels * DEFAULT_SAMPLE_WIDTH
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF',
+        riff_size,
+        b'WAVE',
+        b'fmt ',
+        16,                          # fmt chunk size
+        1,                           # PCM format tag
+        channels,
+        sample_rate,
+        sample_rate * block_align,   # byte rate
+        block_align,
+        DEFAULT_SAMPLE_WIDTH * 8,    # bits per sample
+        b'data',
+        data_size
     )
+
+
+def _write_all(fd: int, *buffers) -> None:
+    """
+    Write whole buffers to a file descriptor, in order.
+    
+    Uses a single writev(2) call for all buffers where available, falling
+    back to one write(2) per buffer.
+    """
+    views = [memoryview(b).cast('B') for b in buffers]
+    
+    if not hasattr(os, "writev"):
+        for view in views:
+            while view:
+                # os.write may write less than requested for large buffers
+                written = os.write(fd, view)
+                view = view[written:]
+        return
     
-    return pcm_bytes
+    while views:
+        written = os.writev(fd, views)
+        # Drop what was written; a partial write resumes mid-buffer
+        while views and written >= len(views[0]):
+            written -= len(views[0])
+            views.pop(0)
+        if written:
+            views[0] = views[0][written:]
 
 
 def _write_wav_file(
     output_path: str,
-    pcm_data: bytes,
+    pcm_data: np.ndarray,
     sample_rate: int,
     channels: int
 ) -> None:
     """
     Write PCM audio data to a WAV file.
     
+    The header is built directly instead of going through the ``wave``
+    module, and header and samples go to the file in a single writev(2)
+    straight from the array's memory, without an intermediate bytes copy.
+    The file is created readable by the owner only.
+    
     Args:
         output_path: Path where the WAV file should be written
-        pcm_data: 16-bit PCM audio data as bytes
+        pcm_data: 16-bit little-endian PCM samples (contiguous array)
         sample_rate: Sample rate in Hz
         channels: Number of audio channels (1 or 2)
     
@@ -218,13 +334,11 @@ def _write_wav_file(
         AudioWriteError: If writing fails
     """
     try:
-        with wave.open(output_path, 'wb') as wav_file:
-            # Set WAV file parameters
-            wav_file.setnchannels(channels)
-            wav_file.setsampwidth(DEFAULT_SAMPLE_WIDTH)  # 16-bit = 2 bytes
-            wav_file.setframerate(sample_rate)
-            
-            # Write audio data
-            wav_file.writeframes(pcm_data)
+        header = wav_header(pcm_data.nbytes, sample_rate, channels)
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            _write_all(fd, header, pcm_data)
+        finally:
+            os.close(fd)
     except Exception as e:
         raise AudioWriteError(f"Failed to write WAV file: {e}") from e
@@ -6,8 +6,75 @@ Handles:
 - Model paths
 - Device selection (CUDA, ROCm, CPU)
 - Port and host settings
+- Model precision
+- Synthesis cache limits
+
+Values that operators may need to tune are read from the environment.
 """
 
+import os
+import sys
+import tempfile
+
+# CUDA caching allocator: grow segments in place instead of allocating new
+# ones, which avoids fragmentation as utterance lengths vary. Must be set
+# before PyTorch initializes CUDA, so it lives here rather than in the engine.
+os.environ.setdefault(
+    "PYTORCH_CUDA_ALLOC_CONF",
+    "expandable_segments:True,max_split_size_mb:256"
+)
+
 # Placeholder configuration
 SERVER_HOST = "127.0.0.1"
 SERVER_PORT = 8000
+
+# Number of server processes; each one loads its own model
+TTS_WORKERS = int(os.getenv("TTS_WORKERS", "1"))
+
+# Maximum number of syntheses running concurrently on the device
+TTS_CONCURRENT_REQUESTS = int(os.getenv("TTS_CONCURRENT_REQUESTS", "2"))
+
+# Numeric precision of the XTTS model: auto, fp32, fp16 (GPU only) or
+# int8 (CPU only). auto uses fp16 autocast on GPU and fp32 on CPU.
+TTS_PRECISION = os.getenv("TTS_PRECISION", "auto").strip().lower()
+
+# Compile the XTTS model with torch.compile on GPU (set to 1 to enable)
+TTS_COMPILE = os.getenv("TTS_COMPILE", "0") == "1"
+
+# Trace the XTTS vocoder with TorchScript on CPU (set to 1 to enable)
+TTS_TORCHSCRIPT = os.getenv("TTS_TORCHSCRIPT", "0") == "1"
+
+# PyTorch intra-op threads for CPU inference (0 keeps PyTorch's default,
+# one per core). Only one model call runs at a time, so capping this only
+# helps when other work shares the machine.
+TTS_CPU_THREADS = int(os.getenv("TTS_CPU_THREADS", "0"))
+
+# Request pooling for batched synthesis
+# Maximum number of texts handed to the engine in one batch
+TTS_MAX_BATCH = int(os.getenv("TTS_MAX_BATCH", "8"))
+# How long the batch worker waits for more requests after the first one
+TTS_BATCH_WINDOW_MS = float(os.getenv("TTS_BATCH_WINDOW_MS", "5"))
+
+# Synthesis cache
+def _default_cache_dir() -> str:
+    """
+    Pick the default cache directory, preferring shared memory (tmpfs) on Linux.
+    
+    Keeping cached WAV files on tmpfs means writing them and serving them
+    back never touches a physical disk. The name includes the user id, so
+    each user gets their own directory; AudioCache refuses it if another
+    user created it first (see core.cache.ensure_private_dir()).
+    """
+    name = f"vox-navigator-{os.getuid()}" if hasattr(os, "getuid") else "vox-navigator"
+    shm_dir = "/dev/shm"
+    if sys.platform.startswith("linux") and os.path.isdir(shm_dir) and os.access(shm_dir, os.W_OK):
+        return os.path.join(shm_dir, name)
+    return os.path.join(tempfile.gettempdir(), name)
+
+
+# Directory holding cached WAV files
+TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR") or _default_cache_dir()
+# Upper bound for the total size of cached WAV files, in bytes
+TTS_CACHE_MAX_BYTES = int(os.getenv("TTS_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+# Lifetime of a cached entry in seconds (0 disables expiry)
+TTS_CACHE_TTL = int(os.getenv("TTS_CACHE_TTL", str(24 * 60 * 60)))
@@ -0,0 +1,460 @@
+"""
+On-disk cache of synthesized audio.
+
+Synthesized WAV files are stored under a name derived from the input text
+and the voice that produced them, so repeated requests for the same text
+are answered from disk instead of running neural inference again.
+
+The cache is bounded:
+- Total size is capped (oldest entries are evicted first)
+- Entries expire after a configurable time-to-live
+
+A small JSON manifest next to the audio files records when each entry was
+created and how long it may live, so stale entries can be evicted without
+inspecting the audio files themselves. The manifest never contains user
+text, only the derived keys.
+
+Several server processes (TTS_WORKERS > 1) may share one cache directory.
+Each process merges its changes into the manifest on disk under an
+exclusive file lock, so the size limit holds for the directory as a whole
+and entries evicted by one worker are forgotten by the others. File locking
+needs fcntl (POSIX); elsewhere give each worker its own cache directory.
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import re
+import stat
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterator, Optional, Set
+
+from core.errors import TTSError
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows: the manifest is then not locked across processes
+    fcntl = None
+
+try:
+    import xxhash
+except ImportError:
+    # Optional: blake2b from hashlib is used instead
+    xxhash = None
+
+logger = logging.getLogger(__name__)
+
+
+class CacheDirectoryError(TTSError):
+    """Raised when a cache directory is not safe to use."""
+    pass
+
+# Size of the canonical RIFF/WAVE header; anything not larger holds no audio
+WAV_HEADER_SIZE = 44
+
+MANIFEST_NAME = "manifest.json"
+
+# Lock file serializing manifest updates across worker processes
+MANIFEST_LOCK_NAME = ".manifest.lock"
+
+# Format of the keys produced by cache_key() (64-bit hex digest)
+_KEY_PATTERN = re.compile(r"[0-9a-f]{16}")
+
+# Numeric fields every manifest entry must have
+_ENTRY_FIELDS = ("size", "created_at", "ttl")
+
+# Number of hot entries whose paths are remembered in memory
+HOT_ENTRIES_MAX = 4096
+
+
+def ensure_private_dir(path: str) -> None:
+    """
+    Create a cache directory readable only by this user, or check an existing one.
+
+    Cache directories usually live in world-writable places (/dev/shm,
+    /tmp). A directory someone else created first would let them plant the
+    files served as cache hits and edit the manifest, so it is refused.
+
+    Args:
+        path: Directory to create or check
+
+    Raises:
+        CacheDirectoryError: If the path is a symlink or not a directory, is
+                             owned by another user, or is writable by group
+                             or others
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    st = os.lstat(path)
+
+    if stat.S_ISLNK(st.st_mode):
+        raise CacheDirectoryError(f"Cache directory is a symlink: {path}")
+    if not stat.S_ISDIR(st.st_mode):
+        raise CacheDirectoryError(f"Cache path is not a directory: {path}")
+    # Ownership and permission bits are POSIX-only
+    if hasattr(os, "getuid"):
+        if st.st_uid != os.getuid():
+            raise CacheDirectoryError(
+                f"Cache directory {path} is owned by uid {st.st_uid}, not {os.getuid()}"
+            )
+        if st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise CacheDirectoryError(
+                f"Cache directory {path} is writable by group or others "
+                f"(mode {stat.S_IMODE(st.st_mode):o})"
+            )
+
+
+def cache_key(text: str, voice_id: str) -> str:
+    """
+    Compute the cache key for a text/voice pair.
+
+    Args:
+        text: Text that is (or will be) synthesized
+        voice_id: Identifier of the voice used for synthesis
+
+    Uses xxHash (XXH3) when the optional ``xxhash`` package is installed
+    and 64-bit BLAKE2b otherwise. Both are non-cryptographic uses here; the
+    key only has to be stable and collision-free across cached entries.
+
+    Returns:
+        str: 16-character hex digest identifying the synthesized audio
+    """
+    payload = text.encode("utf-8") + b"|" + voice_id.encode("utf-8")
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(payload)
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
+class AudioCache:
+    """
+    Bounded directory of synthesized WAV files.
+
+    Entries are published atomically: audio is written to a temporary file
+    first and renamed into place by store(), so lookup() never returns a
+    partially written file.
+
+    Recently used entries are also kept in an in-memory LRU map, so hot
+    prompts are answered with a single stat() that confirms the file is
+    still there (another worker or tmpfs cleanup may have removed it).
+
+    All methods are safe to call from multiple threads, and several
+    processes may share one cache directory (see the module docstring).
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int, ttl: int):
+        """
+        Open (or create) a cache directory.
+
+        Args:
+            cache_dir: Directory holding the cached WAV files
+            max_bytes: Upper bound for the total size of cached files
+            ttl: Lifetime of an entry in seconds (0 disables expiry)
+
+        Raises:
+            CacheDirectoryError: If the directory is not private to this user
+                                 (see ensure_private_dir())
+        """
+        ensure_private_dir(cache_dir)
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._manifest_path = os.path.join(self.cache_dir, MANIFEST_NAME)
+        self._manifest_lock_path = os.path.join(self.cache_dir, MANIFEST_LOCK_NAME)
+        self._lock = threading.Lock()
+        self._hot: "OrderedDict[str, str]" = OrderedDict()
+        # Changes not yet merged into the manifest on disk
+        self._unsaved: Set[str] = set()
+        self._forgotten: Set[str] = set()
+
+        with self._lock, self._manifest_lock():
+            self._entries: Dict[str, dict] = self._load_manifest()
+            self._enforce_limits()
+            self._save_manifest()
+
+    def path_for(self, key: str) -> str:
+        """
+        Return the final path of the cache entry for a key.
+        """
+        return os.path.join(self.cache_dir, f"tts_{key}.wav")
+
+    def temp_path_for(self, key: str) -> str:
+        """
+        Return a private path where a new entry can be written before store().
+
+        The name keeps the .wav suffix (audio backends pick the format from
+        it) and is hidden so it is never mistaken for a published entry.
+        """
+        return os.path.join(
+            self.cache_dir,
+            f".tts_{key}.{os.getpid()}.{threading.get_ident()}.wav"
+        )
+
+    def lookup(self, key: str) -> Optional[str]:
+        """
+        Return the path of a cached entry, or None on a miss.
+
+        Args:
+            key: Cache key from cache_key()
+
+        Returns:
+            Path to a complete WAV file, or None if the entry is missing,
+            empty or expired
+        """
+        # Stat even hot entries: another worker's sweep or tmpfs cleanup
+        # may have removed the file since it was remembered
+        path = self.path_for(key)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._hot.pop(key, None)
+                if self._entries.pop(key, None) is not None:
+                    self._forgotten.add(key)
+                    self._unsaved.discard(key)
+            return None
+
+        if st.st_size <= WAV_HEADER_SIZE:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry, time.time()):
+                self._hot.pop(key, None)
+                return None
+            self._remember(key, path)
+
+        return path
+
+    def store(self, key: str, produced_path: str) -> str:
+        """
+        Publish a freshly synthesized file as the cache entry for a key.
+
+        Args:
+            key: Cache key from cache_key()
+            produced_path: File written by the engine (usually temp_path_for())
+
+        Returns:
+            str: Final path of the cache entry
+        """
+        path = self.path_for(key)
+        if produced_path != path:
+            os.replace(produced_path, path)
+
+        with self._lock:
+            self._entries[key] = {
+                "size": os.path.getsize(path),
+                "created_at": time.time(),
+                "ttl": self.ttl,
+            }
+            self._unsaved.add(key)
+            self._forgotten.discard(key)
+            self._sweep()
+            if key in self._entries:
+                self._remember(key, path)
+
+        return path
+
+    def evict_expired(self) -> int:
+        """
+        Remove all entries whose time-to-live has elapsed.
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock, self._manifest_lock():
+            self._merge_manifest()
+            removed = self._evict_expired(time.time())
+            if removed:
+                self._save_manifest()
+            return removed
+
+    def _is_expired(self, entry: dict, now: float) -> bool:
+        ttl = entry.get("ttl", 0)
+        return ttl > 0 and entry.get("created_at", 0) + ttl < now
+
+    def _remember(self, key: str, path: str) -> None:
+        """
+        Record a hot entry in the in-memory LRU. Must be called with the lock held.
+        """
+        self._hot[key] = path
+        self._hot.move_to_end(key)
+        while len(self._hot) > HOT_ENTRIES_MAX:
+            self._hot.popitem(last=False)
+
+    def _remove(self, key: str) -> None:
+        self._hot.pop(key, None)
+        if self._entries.pop(key, None) is None:
+            return
+        # Always derived from the key: the manifest is shared with other
+        # processes and must never decide which file gets deleted
+        path = self.path_for(key)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to remove cached audio {path}: {e}")
+
+    def _evict_expired(self, now: float) -> int:
+        expired = [k for k, e in self._entries.items() if self._is_expired(e, now)]
+        for key in expired:
+            self._remove(key)
+        return len(expired)
+
+    @contextlib.contextmanager
+    def _manifest_lock(self) -> Iterator[None]:
+        """
+        Hold an exclusive lock on the manifest across processes.
+
+        A no-op where fcntl is unavailable.
+        """
+        if fcntl is None:
+            yield
+            return
+
+        with open(self._manifest_lock_path, "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _merge_manifest(self) -> None:
+        """
+        Bring in changes other processes made to the manifest.
+
+        Entries stored here since the last save win over the manifest on
+        disk; entries that are gone from it were evicted by another worker
+        and are forgotten. Must be called with both locks held.
+        """
+        disk = self._read_manifest()
+        if disk is None:
+            return
+
+        merged = {k: e for k, e in disk.items() if k not in self._forgotten}
+        for key in self._unsaved:
+            entry = self._entries.get(key)
+            if entry is not None:
+                merged[key] = entry
+
+        for key in [k for k in self._hot if k not in merged]:
+            del self._hot[key]
+        self._entries = merged
+
+    def _sweep(self) -> None:
+        """
+        Merge with the manifest on disk, enforce TTL and size limits and
+        persist the result.
+
+        Must be called with the lock held.
+        """
+        with self._manifest_lock():
+            self._merge_manifest()
+            self._enforce_limits()
+            self._save_manifest()
+
+    def _enforce_limits(self) -> None:
+        """
+        Evict expired entries, then the oldest ones while over the size limit.
+
+        Must be called with the lock held.
+        """
+        self._evict_expired(time.time())
+
+        total = sum(e.get("size", 0) for e in self._entries.values())
+        if total > self.max_bytes:
+            # Oldest entries go first
+            for key in sorted(self._entries, key=lambda k: self._entries[k]["created_at"]):
+                if total <= self.max_bytes:
+                    break
+                total -= self._entries[key].get("size", 0)
+                self._remove(key)
+
+    def _read_manifest(self) -> Optional[Dict[str, dict]]:
+        """
+        Read the manifest file, or return None if it is missing or unreadable.
+
+        Keys not in the cache_key() format and entries without numeric
+        size, created_at and ttl fields are dropped with a warning, so a
+        damaged manifest costs cache hits rather than failing startup. File
+        paths are never taken from the manifest (see path_for()); a "path"
+        field written by older versions is ignored.
+        """
+        try:
+            with open(self._manifest_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache manifest: {e}")
+            return None
+
+        if not isinstance(entries, dict):
+            logger.warning("Ignoring cache manifest that is not a JSON object")
+            return None
+
+        valid: Dict[str, dict] = {}
+        for key, entry in entries.items():
+            if not (_KEY_PATTERN.fullmatch(key) and isinstance(entry, dict)):
+                logger.warning(f"Dropping invalid cache manifest entry {key!r}")
+                continue
+            fields = {f: entry.get(f) for f in _ENTRY_FIELDS}
+            if not all(
+                isinstance(v, (int, float)) and not isinstance(v, bool)
+                for v in fields.values()
+            ):
+                logger.warning(f"Dropping malformed cache manifest entry {key!r}")
+                continue
+            valid[key] = fields
+        return valid
+
+    def _load_manifest(self) -> Dict[str, dict]:
+        """
+        Load the manifest and reconcile it with the files on disk.
+        """
+        entries = self._read_manifest() or {}
+
+        # Drop entries whose files are gone
+        entries = {
+            k: e for k, e in entries.items()
+            if os.path.exists(self.path_for(k))
+        }
+
+        # Adopt files that are on disk but missing from the manifest
+        for name in os.listdir(self.cache_dir):
+            if not (name.startswith("tts_") and name.endswith(".wav")):
+                continue
+            key = name[len("tts_"):-len(".wav")]
+            if key in entries or not _KEY_PATTERN.fullmatch(key):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries[key] = {
+                "size": st.st_size,
+                "created_at": st.st_mtime,
+                "ttl": self.ttl,
+            }
+
+        return entries
+
+    def _save_manifest(self) -> None:
+        """
+        Atomically rewrite the manifest. Must be called with both locks held.
+        """
+        tmp_path = f"{self._manifest_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self._manifest_path)
+        except OSError as e:
+            logger.warning(f"Failed to write cache manifest: {e}")
+            return
+        self._unsaved.clear()
+        self._forgotten.clear()
@@ -11,8 +11,13 @@ Supported backends:
 
 The rest of the application must NOT assume any vendor-specific APIs.
 All hardware decisions must be centralized here.
+
+Detection runs once and its result is cached (see detect_device()); the
+cache is filled when this module is imported, so the first health check
+or synthesis request does not pay for CUDA initialization.
 """
 
+import functools
 from dataclasses import dataclass
 from typing import Optional
 
@@ -28,10 +33,15 @@ class DeviceInfo:
     details: Optional[str] = None
 
 
+@functools.lru_cache(maxsize=1)
 def detect_device() -> DeviceInfo:
     """
     Detect the best available compute device.
 
+    The result is cached: only the first call probes the hardware, later
+    calls return the same DeviceInfo. Use detect_device.cache_clear() to
+    force a new detection (e.g. in tests).
+
     Detection order:
     1. NVIDIA GPU via CUDA
     2. AMD GPU via ROCm (HIP)
@@ -82,6 +92,7 @@ def detect_device() -> DeviceInfo:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def _get_gpu_name() -> str:
     """
     Return the name of the first available GPU, if possible.
@@ -91,3 +102,7 @@ def _get_gpu_name() -> str:
         return torch.cuda.get_device_name(0)
     except Exception:
         return "Unknown GPU"
+
+
+# Fill the cache at import time
+detect_device()
@@ -14,105 +14,171 @@ The manager abstracts away vendor-specific details (CUDA, ROCm) and
 provides a unified interface for the API layer.
 """
 
-import hashlib
+import asyncio
 import logging
 import os
 import tempfile
+import threading
 import time
-from typing import Optional
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Union
 
+import numpy as np
+
+import config
+from audio.writer import wav_header
+from core.cache import AudioCache, CacheDirectoryError, cache_key
 from core.device import detect_device, DeviceInfo
 from core.errors import EngineLoadError, DeviceError, SynthesisError
-from engines.xtts_engine import XTTSEngine
+
+if TYPE_CHECKING:
+    # Imported lazily in _initialize_engine(): the XTTS module pulls in the
+    # model stack, which the health endpoints never need
+    from engines.xtts_engine import XTTSEngine
 
 logger = logging.getLogger(__name__)
 
 
+def _as_tts_error(error: Exception) -> Exception:
+    """
+    Map an engine failure to the error reported to callers.
+    
+    SynthesisError and EngineLoadError are passed through; anything else is
+    wrapped in a SynthesisError chained to the original exception.
+    """
+    if isinstance(error, (SynthesisError, EngineLoadError)):
+        return error
+    wrapped = SynthesisError(
+        f"Unexpected TTS runtime error: {type(error).__name__}: {error}"
+    )
+    wrapped.__cause__ = error
+    return wrapped
+
+
 class EngineManager:
     """
     Manages TTS engine instances with lazy initialization and device selection.
     
-    This class implements a singleton-like pattern where a single engine
-    instance is shared across all requests. The engine is initialized on
-    first use, not at import time.
+    A single shared instance, ``engine_manager``, is created when this
+    module is imported and used for all requests. The engine itself is
+    initialized on first use, not at import time.
     
     Device selection follows this priority:
     1. GPU (CUDA or ROCm) if available
     2. CPU fallback if GPU fails or is unavailable
     """
     
-    _instance: Optional['EngineManager'] = None
-    _engine: Optional[XTTSEngine] = None
-    _device_info: Optional[DeviceInfo] = None
-    _initialized: bool = False
-    
-    def __new__(cls):
-        """
-        Ensure only one EngineManager instance exists per process.
-        """
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-    
     def __init__(self):
         """
         Initialize the engine manager.
         
         Note: Engine is not loaded here. Use get_engine() for lazy initialization.
         """
-        if not self._initialized:
-            self._engine = None
-            self._device_info = None
-            self._initialized = True
+        self._engine: Optional["XTTSEngine"] = None
+        # Set once the engine's model is loaded and warmed up
+        self._warmed = False
+        # Set only when get_engine() had to fall back to CPU
+        self._device_override: Optional[DeviceInfo] = None
+        self._caches: Dict[Optional[str], AudioCache] = {}
+        self._caches_lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._pending: Optional[asyncio.Queue] = None
+        self._batch_slots: Optional[asyncio.Semaphore] = None
+        self._batch_task: Optional[asyncio.Task] = None
     
     def get_device_info(self) -> DeviceInfo:
         """
         Get the detected device information.
         
+        Detection itself is cached by detect_device(), so this does not
+        probe the hardware again. After a CPU fallback in get_engine() the
+        CPU device is returned instead.
+        
         Returns:
             DeviceInfo: Information about the selected compute device
             
         Raises:
             DeviceError: If device detection fails completely
         """
-        if self._device_info is None:
-            try:
-                self._device_info = detect_device()
-                logger.info(
-                    f"Device detected: {self._device_info.name} "
-                    f"({self._device_info.type})"
-                )
-                if self._device_info.details:
-                    logger.info(f"Device details: {self._device_info.details}")
-            except Exception as e:
-                logger.error(f"Device detection failed: {e}")
-                raise DeviceError(f"Failed to detect compute device: {e}") from e
+        if self._device_override is not None:
+            return self._device_override
         
-        return self._device_info
+        try:
+            return detect_device()
+        except Exception as e:
+            logger.error(f"Device detection failed: {e}")
+            raise DeviceError(f"Failed to detect compute device: {e}") from e
     
-    def get_engine(self) -> XTTSEngine:
+    def get_engine(self) -> "XTTSEngine":
         """
         Get or initialize the TTS engine (lazy initialization).
         
         The engine is initialized on first call. If GPU initialization fails,
-        the manager automatically falls back to CPU.
+        the manager automatically falls back to CPU. The model is then loaded
+        and warmed up (see _warm_engine()), so kernel selection and memory
+        pool growth happen here rather than inside the first synthesis.
         
         Returns:
             XTTSEngine: Initialized TTS engine instance
             
         Raises:
-            EngineLoadError: If engine initialization fails on all devices
+            EngineLoadError: If engine initialization fails on all devices,
+                             or the model cannot be loaded
         """
-        if self._engine is not None:
+        if self._warmed:
             return self._engine
         
+        engine = self._get_unwarmed_engine()
+        self._warm_engine(engine)
+        return engine
+    
+    def _get_unwarmed_engine(self) -> "XTTSEngine":
+        """
+        Get or create the engine without loading its model.
+        
+        Enough for lookups that only need the engine's voice id. The first
+        call still creates the engine, which imports the model stack, so
+        async callers must run it in a worker thread.
+        
+        Raises:
+            EngineLoadError: If engine initialization fails on all devices
+        """
+        if self._engine is None:
+            self._create_engine()
+        return self._engine
+    
+    def _warm_engine(self, engine: "XTTSEngine") -> None:
+        """
+        Load the engine's model once; loading runs a warmup synthesis.
+        
+        Args:
+            engine: Engine created by get_engine()
+        
+        Raises:
+            EngineLoadError: If the model cannot be loaded
+        """
+        t0 = time.perf_counter()
+        engine.load_model()
+        self._warmed = True
+        logger.info(f"Engine warmed up in {(time.perf_counter() - t0) * 1000:.0f} ms")
+    
+    def _create_engine(self) -> None:
+        """
+        Create the engine on the detected device, falling back to CPU.
+        
+        Raises:
+            EngineLoadError: If engine initialization fails on all devices
+        """
         device_info = self.get_device_info()
+        logger.info(f"Device detected: {device_info.name} ({device_info.type})")
+        if device_info.details:
+            logger.info(f"Device details: {device_info.details}")
         
         # Try to initialize engine with detected device
         try:
             self._engine = self._initialize_engine(device_info)
             logger.info(f"Engine initialized successfully on {device_info.name}")
-            return self._engine
         except Exception as e:
             logger.warning(
                 f"Engine initialization failed on {device_info.name}: {e}"
@@ -130,8 +196,7 @@ class EngineManager:
                     )
                     self._engine = self._initialize_engine(cpu_device)
                     logger.info("Engine initialized successfully on CPU (fallback)")
-                    self._device_info = cpu_device
-                    return self._engine
+                    self._device_override = cpu_device
                 except Exception as cpu_error:
                     logger.error(f"CPU fallback also failed: {cpu_error}")
                     raise EngineLoadError(
@@ -144,7 +209,7 @@ class EngineManager:
                     f"Engine initialization failed on CPU: {e}"
                 ) from e
     
-    def _initialize_engine(self, device_info: DeviceInfo) -> XTTSEngine:
+    def _initialize_engine(self, device_info: DeviceInfo) -> "XTTSEngine":
         """
         Initialize a TTS engine for the given device.
         
@@ -158,9 +223,15 @@ class EngineManager:
             EngineLoadError: If engine initialization fails
         """
         try:
-            engine = XTTSEngine(device=device_info.type)
-            # Model loading will be implemented later
-            # For now, engine is instantiated but not fully loaded
+            from engines.xtts_engine import XTTSEngine
+            
+            engine = XTTSEngine(
+                device=device_info.type,
+                precision=config.TTS_PRECISION,
+                compile_model=config.TTS_COMPILE,
+                trace_vocoder=config.TTS_TORCHSCRIPT,
+                cpu_threads=config.TTS_CPU_THREADS
+            )
             logger.debug(
                 f"Engine instance created for device: {device_info.type}"
             )
@@ -180,10 +251,15 @@ class EngineManager:
         - Audio file generation
         - File path management
         
+        Audio is cached on disk keyed by text and voice; a repeated request
+        returns the existing file without running inference. Concurrent
+        requests for the same text share a single synthesis.
+        
         Args:
             text: Input text to synthesize
             output_dir: Optional directory for output files. If None, uses
-                       a temporary directory.
+                       the default cache directory (TTS_CACHE_DIR, tmpfs
+                       under /dev/shm on Linux when available).
         
         Returns:
             str: Path to the generated WAV audio file
@@ -192,27 +268,72 @@ class EngineManager:
             EngineLoadError: If engine cannot be initialized
             SynthesisError: If synthesis fails
         """
-        if not text or not text.strip():
-            raise SynthesisError("Text input cannot be empty")
-        
         engine = self.get_engine()
+        cache = self._get_cache(output_dir)
+        
+        # Serve previously synthesized audio for the same text and voice
+        key = cache_key(text, engine.get_voice_id())
+        cached_path = cache.lookup(key)
+        if cached_path is not None:
+            logger.debug(f"Cache hit: {cached_path}")
+            return cached_path
+        
+        # Coalesce concurrent requests for the same audio: the first caller
+        # synthesizes, the others wait for its result
+        flight_key = cache.path_for(key)
+        with self._inflight_lock:
+            future = self._inflight.get(flight_key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[flight_key] = future
         
-        # Determine output directory
-        if output_dir is None:
-            output_dir = tempfile.gettempdir()
-        else:
-            os.makedirs(output_dir, exist_ok=True)
+        if not is_leader:
+            logger.debug("Waiting for in-flight synthesis of the same text")
+            return future.result()
         
-        # Generate unique filename
-        text_hash = hashlib.md5(text.encode()).hexdigest()[:8]
-        timestamp = int(time.time())
-        filename = f"tts_{timestamp}_{text_hash}.wav"
-        output_path = os.path.join(output_dir, filename)
+        try:
+            audio_path = self._synthesize_to_cache(engine, cache, key, text)
+            future.set_result(audio_path)
+            return audio_path
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(flight_key, None)
+    
+    def _synthesize_to_cache(
+        self,
+        engine: "XTTSEngine",
+        cache: AudioCache,
+        key: str,
+        text: str
+    ) -> str:
+        """
+        Run the engine for a cache miss and publish the result.
+        
+        Args:
+            engine: Initialized engine
+            cache: Cache receiving the audio
+            key: Cache key for the text
+            text: Input text to synthesize
+        
+        Returns:
+            str: Path to the cached WAV audio file
+        
+        Raises:
+            EngineLoadError: If engine cannot be initialized
+            SynthesisError: If synthesis fails
+        """
+        # Synthesize into a private file; it is published on success only
+        output_path = cache.temp_path_for(key)
         
         # Synthesize audio using the engine
         try:
             # Call engine.synthesize() to perform actual TTS synthesis
             audio_path = engine.synthesize(text=text, output_path=output_path)
+            audio_path = cache.store(key, audio_path)
             
             logger.debug(f"Audio file created: {audio_path}")
             return audio_path
@@ -261,6 +382,354 @@ class EngineManager:
                 f"Unexpected TTS runtime error: {type(e).__name__}: {e}"
             ) from e
     
+    def synthesize_batch(
+        self,
+        texts: List[str],
+        output_dir: Optional[str] = None,
+        return_exceptions: bool = False
+    ) -> List[Union[str, Exception]]:
+        """
+        Synthesize several texts in one engine call.
+        
+        Cached texts are answered from the cache, duplicates are synthesized
+        once, and the remaining texts are handed to the engine together so
+        engines with batched inference can process them in a single pass.
+        A text that fails does not stop the others; their audio is still
+        synthesized and cached.
+        
+        Args:
+            texts: Input texts to synthesize
+            output_dir: Optional cache directory (see synthesize())
+            return_exceptions: If True, the error of a failing text is
+                             returned in its place instead of being raised
+        
+        Returns:
+            List[Union[str, Exception]]: Path to the WAV audio file for each
+            text, in order (or the item's error, see return_exceptions)
+        
+        Raises:
+            EngineLoadError: If engine cannot be initialized
+            SynthesisError: If synthesis fails for any of the texts and
+                            return_exceptions is False
+        """
+        engine = self.get_engine()
+        cache = self._get_cache(output_dir)
+        voice_id = engine.get_voice_id()
+        keys = [cache_key(text, voice_id) for text in texts]
+        
+        results: Dict[str, Union[str, Exception]] = {}
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key in results or key in missing:
+                continue
+            cached_path = cache.lookup(key)
+            if cached_path is not None:
+                results[key] = cached_path
+            else:
+                missing[key] = text
+        
+        if missing:
+            missing_keys = list(missing)
+            output_paths = [cache.temp_path_for(key) for key in missing_keys]
+            try:
+                produced = engine.synthesize_batch(
+                    texts=[missing[key] for key in missing_keys],
+                    output_paths=output_paths,
+                    return_exceptions=True
+                )
+            except Exception as e:
+                # The batch as a whole failed (e.g. the model did not load)
+                produced = [e] * len(missing_keys)
+            
+            for key, output_path, result in zip(missing_keys, output_paths, produced):
+                if not isinstance(result, Exception):
+                    try:
+                        results[key] = cache.store(key, result)
+                        continue
+                    except Exception as e:
+                        result = e
+                if os.path.exists(output_path):
+                    try:
+                        os.remove(output_path)
+                    except Exception:
+                        pass
+                results[key] = _as_tts_error(result)
+        
+        ordered = [results[key] for key in keys]
+        if not return_exceptions:
+            for result in ordered:
+                if isinstance(result, Exception):
+                    raise result
+        return ordered
+    
+    async def start_batching(self, slots: Optional[asyncio.Semaphore] = None) -> None:
+        """
+        Start the background worker that pools requests made via asynthesize().
+        
+        Must be called from the running event loop (e.g. an app lifespan hook).
+        
+        Args:
+            slots: Optional semaphore shared with other device users; the
+                   worker holds one slot while a batch is being synthesized
+        """
+        if self._batch_task is not None:
+            return
+        self._pending = asyncio.Queue()
+        self._batch_slots = slots
+        self._batch_task = asyncio.create_task(self._batch_worker())
+        logger.info(
+            f"Batch worker started (max batch {config.TTS_MAX_BATCH}, "
+            f"window {config.TTS_BATCH_WINDOW_MS} ms)"
+        )
+    
+    async def stop_batching(self) -> None:
+        """
+        Stop the batch worker and fail requests that are still queued.
+        """
+        task = self._batch_task
+        if task is None:
+            return
+        self._batch_task = None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        
+        while not self._pending.empty():
+            _, _, future = self._pending.get_nowait()
+            if not future.done():
+                future.set_exception(SynthesisError("TTS server is shutting down"))
+    
+    async def asynthesize(self, text: str, output_dir: Optional[str] = None) -> str:
+        """
+        Asynchronous variant of synthesize().
+        
+        When the batch worker is running, the request is queued and
+        synthesized together with other requests for the same output
+        directory arriving within the batching window. Otherwise synthesize()
+        runs in a worker thread. Either way the event loop is never blocked.
+        
+        Args:
+            text: Input text to synthesize
+            output_dir: Optional cache directory (see synthesize())
+        
+        Returns:
+            str: Path to the generated WAV audio file
+        
+        Raises:
+            EngineLoadError: If engine cannot be initialized
+            SynthesisError: If synthesis fails
+        """
+        if self._batch_task is None:
+            return await asyncio.to_thread(self.synthesize, text, output_dir)
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._pending.put((text, output_dir, future))
+        return await future
+    
+    async def _batch_worker(self) -> None:
+        """
+        Pool queued requests into batches and synthesize them off the event loop.
+        """
+        window = config.TTS_BATCH_WINDOW_MS / 1000.0
+        
+        while True:
+            items = [await self._pending.get()]
+            
+            # From here on the items are ours: a cancellation at any await
+            # below must fail them, since stop_batching() only drains the queue
+            try:
+                # Give concurrent requests a moment to join the batch
+                if window > 0:
+                    await asyncio.sleep(window)
+                while len(items) < config.TTS_MAX_BATCH:
+                    try:
+                        items.append(self._pending.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                
+                # Skip requests whose callers have gone away
+                live = [item for item in items if not item[2].done()]
+                
+                # One engine call per output directory
+                groups: Dict[Optional[str], List] = {}
+                for text, output_dir, future in live:
+                    groups.setdefault(output_dir, []).append((text, future))
+                
+                for output_dir, group in groups.items():
+                    await self._run_batch(group, output_dir)
+            except asyncio.CancelledError:
+                for _, _, future in items:
+                    if not future.done():
+                        future.set_exception(SynthesisError("TTS server is shutting down"))
+                raise
+    
+    async def _run_batch(self, items: List, output_dir: Optional[str]) -> None:
+        """
+        Synthesize one pooled batch and resolve each waiting future with the
+        outcome of its own text.
+        
+        Args:
+            items: (text, future) pairs of the queued requests
+            output_dir: Cache directory shared by all requests in the batch
+        """
+        texts = [text for text, _ in items]
+        try:
+            if self._batch_slots is not None:
+                async with self._batch_slots:
+                    results = await asyncio.to_thread(
+                        self.synthesize_batch, texts, output_dir, True
+                    )
+            else:
+                results = await asyncio.to_thread(
+                    self.synthesize_batch, texts, output_dir, True
+                )
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        # Each caller gets its own outcome; a bad text only fails its request
+        for (_, future), result in zip(items, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+    
+    def get_cached(self, text: str, output_dir: Optional[str] = None) -> Optional[str]:
+        """
+        Return the path of previously synthesized audio for a text, if any.
+        
+        Does not load the model, but the first call creates the engine and
+        opens the cache directory, so it blocks; call it via
+        asyncio.to_thread() from async code.
+        
+        Args:
+            text: Input text
+            output_dir: Optional cache directory (see synthesize())
+        
+        Returns:
+            Path to the cached WAV file, or None if the text is not cached
+        """
+        # Only the voice id is needed, so the model is not loaded here
+        engine = self._get_unwarmed_engine()
+        return self._get_cache(output_dir).lookup(cache_key(text, engine.get_voice_id()))
+    
+    def synthesize_stream(
+        self,
+        text: str,
+        output_dir: Optional[str] = None
+    ) -> Iterator[bytes]:
+        """
+        Synthesize speech from text and yield a WAV byte stream.
+        
+        The first chunk holds the WAV header (with an open-ended length)
+        followed by the first PCM block, so callers can start playback as soon
+        as the engine produces audio. Once the stream completes, the audio is
+        also stored in the cache so later requests for the same text are
+        served from disk.
+        
+        Args:
+            text: Input text to synthesize
+            output_dir: Optional cache directory (see synthesize())
+        
+        Yields:
+            bytes: Consecutive chunks of a 16-bit mono WAV file
+        
+        Raises:
+            EngineLoadError: If engine cannot be initialized
+            SynthesisError: If synthesis fails
+            NotImplementedError: If the engine cannot stream
+        """
+        engine = self.get_engine()
+        cache = self._get_cache(output_dir)
+        key = cache_key(text, engine.get_voice_id())
+        
+        chunks = engine.synthesize_stream(text)
+        
+        # Wait for the first block of audio before emitting anything, so
+        # errors surface before the response has started
+        try:
+            first = next(chunks)
+        except StopIteration:
+            raise SynthesisError("Streaming synthesis produced no audio")
+        except (SynthesisError, EngineLoadError, NotImplementedError):
+            raise
+        except Exception as e:
+            raise SynthesisError(
+                f"Unexpected TTS runtime error: {type(e).__name__}: {e}"
+            ) from e
+        
+        sample_rate = engine.get_sample_rate()
+        pcm_chunks = [first]
+        yield wav_header(None, sample_rate, 1) + first
+        
+        for chunk in chunks:
+            pcm_chunks.append(chunk)
+            yield chunk
+        
+        # Publish the complete utterance to the cache
+        output_path = cache.temp_path_for(key)
+        try:
+            pcm = np.frombuffer(b"".join(pcm_chunks), dtype="<i2")
+            engine.write_audio(pcm, output_path, sample_rate=sample_rate)
+            cache.store(key, output_path)
+        except Exception as e:
+            logger.warning(f"Failed to cache streamed audio: {e}")
+            if os.path.exists(output_path):
+                try:
+                    os.remove(output_path)
+                except Exception:
+                    pass
+    
+    def _get_cache(self, output_dir: Optional[str] = None) -> AudioCache:
+        """
+        Get the audio cache for an output directory, opening it on first use.
+        
+        Args:
+            output_dir: Cache directory, or None for the default one
+        
+        Returns:
+            AudioCache: Cache rooted at the requested directory
+        
+        Raises:
+            CacheDirectoryError: If an explicitly requested directory is not
+                                 private to this user. An unsafe default
+                                 directory is replaced by a fresh private one.
+        """
+        cache = self._caches.get(output_dir)
+        if cache is None:
+            with self._caches_lock:
+                cache = self._caches.get(output_dir)
+                if cache is None:
+                    cache = self._open_cache(output_dir)
+                    self._caches[output_dir] = cache
+        return cache
+    
+    def _open_cache(self, output_dir: Optional[str]) -> AudioCache:
+        """
+        Open the cache for a directory (None for TTS_CACHE_DIR).
+        
+        Raises:
+            CacheDirectoryError: If the directory is not safe to use
+        """
+        limits = dict(max_bytes=config.TTS_CACHE_MAX_BYTES, ttl=config.TTS_CACHE_TTL)
+        if output_dir is not None:
+            return AudioCache(output_dir, **limits)
+        
+        try:
+            return AudioCache(config.TTS_CACHE_DIR, **limits)
+        except CacheDirectoryError as e:
+            # Someone else got to the shared location first; use a private
+            # directory of our own rather than trusting theirs
+            fallback = tempfile.mkdtemp(prefix="vox-navigator-")
+            logger.warning(f"{e}; caching audio in {fallback} instead")
+            return AudioCache(fallback, **limits)
+    
     def is_initialized(self) -> bool:
         """
         Check if the engine has been initialized.
@@ -275,6 +744,10 @@ class EngineManager:
         Get the currently selected device information.
         
         Returns:
-            DeviceInfo if device has been detected, None otherwise
+            DeviceInfo: The detected device, or the CPU after a fallback
         """
-        return self._device_info
+        return self.get_device_info()
+
+
+# Shared instance used by the API layer
+engine_manager = EngineManager()
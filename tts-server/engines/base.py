@@ -17,10 +17,18 @@ Concrete implementations must handle:
 - Device-specific optimizations (internally)
 """
 
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterator, List, Optional, Union
+
+import numpy as np
 
 from core.errors import SynthesisError, TTSError
+from audio.writer import DEFAULT_SAMPLE_RATE, write_wav
+
+# Size of the reusable PCM conversion buffer (30 s of 24 kHz mono audio);
+# longer clips fall back to a one-off allocation
+PCM_SCRATCH_SAMPLES = 30 * 24000
 
 
 class BaseTTSEngine(ABC):
@@ -58,6 +66,8 @@ class BaseTTSEngine(ABC):
         """
         self.device = device
         self._model_loaded = False
+        self._pcm_scratch: Optional[np.ndarray] = None
+        self._pcm_scratch_lock = threading.Lock()
     
     @abstractmethod
     def synthesize(self, text: str, output_path: Optional[str] = None) -> str:
@@ -97,6 +107,71 @@ class BaseTTSEngine(ABC):
         """
         pass
     
+    def synthesize_batch(
+        self,
+        texts: List[str],
+        output_paths: List[str],
+        return_exceptions: bool = False
+    ) -> List[Union[str, Exception]]:
+        """
+        Synthesize several texts and return the paths to their audio files.
+        
+        Engines whose models accept batched input override this to run the
+        texts through the model together. The default implementation
+        synthesizes them one after another.
+        
+        Args:
+            texts: Input texts to synthesize. Each must be non-empty.
+            output_paths: Output path for each text (same length as texts)
+            return_exceptions: If True, a failing text does not stop the
+                             batch; its exception is returned in its place
+        
+        Returns:
+            List[Union[str, Exception]]: Absolute path of the WAV file for
+            each text, in order (or the item's exception, see return_exceptions)
+        
+        Raises:
+            SynthesisError: If synthesis fails for any of the texts and
+                            return_exceptions is False
+        """
+        if len(texts) != len(output_paths):
+            raise SynthesisError(
+                f"Got {len(texts)} texts but {len(output_paths)} output paths"
+            )
+        
+        results: List[Union[str, Exception]] = []
+        for text, output_path in zip(texts, output_paths):
+            try:
+                results.append(self.synthesize(text=text, output_path=output_path))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+    
+    def synthesize_stream(self, text: str) -> Iterator[bytes]:
+        """
+        Synthesize speech incrementally and yield raw audio as it is produced.
+        
+        Engines whose models can generate audio progressively override this
+        so callers can start playback before synthesis has finished. The
+        default implementation reports that streaming is unavailable.
+        
+        Args:
+            text: Input text to synthesize. Must be non-empty.
+        
+        Yields:
+            bytes: Consecutive chunks of 16-bit little-endian mono PCM at
+                   get_sample_rate() Hz (no WAV header)
+        
+        Raises:
+            NotImplementedError: If the engine cannot stream
+            SynthesisError: If synthesis fails
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support streaming synthesis"
+        )
+    
     @abstractmethod
     def load_model(self, model_path: Optional[str] = None) -> None:
         """
@@ -142,6 +217,66 @@ class BaseTTSEngine(ABC):
         """
         return self.device
     
+    def write_audio(
+        self,
+        audio_data,
+        output_path: str,
+        sample_rate: Optional[int] = None
+    ) -> str:
+        """
+        Write mono audio produced by this engine to a WAV file.
+        
+        PCM conversion goes through a scratch buffer owned by the engine,
+        allocated once and reused for every clip, instead of a fresh buffer
+        per request.
+        
+        Args:
+            audio_data: Audio samples (see audio.writer.write_wav)
+            output_path: Path where the WAV file should be written
+            sample_rate: Sample rate in Hz. Defaults to get_sample_rate().
+        
+        Returns:
+            str: Absolute path to the written WAV file
+        
+        Raises:
+            AudioWriteError: If writing fails
+        """
+        if sample_rate is None:
+            sample_rate = self.get_sample_rate()
+        
+        with self._pcm_scratch_lock:
+            if self._pcm_scratch is None:
+                self._pcm_scratch = np.empty(PCM_SCRATCH_SAMPLES, dtype='<i2')
+            return write_wav(
+                audio_data=audio_data,
+                output_path=output_path,
+                sample_rate=sample_rate,
+                channels=1,
+                scratch=self._pcm_scratch
+            )
+    
+    def get_sample_rate(self) -> int:
+        """
+        Get the sample rate of the audio produced by this engine.
+        
+        Returns:
+            int: Sample rate in Hz
+        """
+        return DEFAULT_SAMPLE_RATE
+    
+    def get_voice_id(self) -> str:
+        """
+        Get an identifier for the voice this engine produces.
+        
+        The engine manager combines it with the input text to key cached
+        audio, so it must change whenever the same text would sound different
+        (other model, speaker reference or language).
+        
+        Returns:
+            str: Stable voice identifier
+        """
+        return type(self).__name__
+    
     def validate_text(self, text: str) -> None:
         """
         Validate text input before synthesis.
@@ -161,14 +296,20 @@ class BaseTTSEngine(ABC):
         if not isinstance(text, str):
             raise SynthesisError(f"Text input must be a string, got {type(text)}")
         
-        text_stripped = text.strip()
-        if not text_stripped:
-            raise SynthesisError("Text input cannot be empty or whitespace only")
+        length = len(text)
+        
+        # Only padded input needs a stripped copy; the common case of text
+        # without leading/trailing whitespace is checked without allocating
+        if text[0].isspace() or text[-1].isspace():
+            text_stripped = text.strip()
+            if not text_stripped:
+                raise SynthesisError("Text input cannot be empty or whitespace only")
+            length = len(text_stripped)
         
         # Reasonable upper limit to prevent resource exhaustion
         # Concrete engines can override this if needed
         max_length = 10000  # characters
-        if len(text_stripped) > max_length:
+        if length > max_length:
             raise SynthesisError(
                 f"Text input exceeds maximum length of {max_length} characters"
             )
\ No newline at end of file
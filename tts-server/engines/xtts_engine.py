@@ -18,19 +18,149 @@ Model: XTTS v2 from Coqui TTS
 Default language: English (can be configured)
 """
 
+import collections
+import concurrent.futures
+import contextlib
 import logging
 import os
+import stat
 import tempfile
-from typing import Optional
+import threading
+from pathlib import Path
+from typing import Iterator, Optional
 
+import numpy as np
 import torch
 
+try:
+    from TTS.api import TTS
+    _TTS_IMPORT_ERROR = None
+except ImportError as e:
+    # Reported by load_model(), so the server still starts without it
+    TTS = None
+    _TTS_IMPORT_ERROR = e
+
 from engines.base import BaseTTSEngine
 from core.errors import EngineLoadError, SynthesisError
-from audio.writer import write_wav, DEFAULT_SAMPLE_RATE
+from audio.writer import AudioWriteError, resolve_output_path
 
 logger = logging.getLogger(__name__)
 
+# Supported values for the engine's numeric precision
+# ('auto' picks fp16 autocast on GPU and fp32 on CPU)
+PRECISIONS = ("auto", "fp32", "fp16", "int8")
+
+# Autocast dtype used on GPU for each reduced precision. bfloat16 is left
+# out on purpose: XTTS converts vocoder output with .numpy(), which has no
+# bfloat16 support.
+_AUTOCAST_DTYPES = {"fp16": torch.float16}
+
+# Reference speaker used for voice cloning, resolved once at import time
+DEFAULT_SPEAKER_PATH = str(
+    Path(__file__).resolve().parent.parent / "assets" / "speakers" / "default_pt.wav"
+)
+
+# Loaded models shared by all engines in the process, keyed by
+# (model name, torch device, precision, compiled)
+_MODEL_CACHE: dict = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+# GPT tokens decoded per streamed chunk; smaller chunks reach the client
+# sooner at the cost of more vocoder calls
+STREAM_CHUNK_SIZE = 20
+
+# All model calls run on one dedicated thread (see _run_inference)
+_INFERENCE_THREAD = threading.local()
+
+
+def _mark_inference_thread() -> None:
+    _INFERENCE_THREAD.active = True
+
+
+_INFERENCE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1,
+    thread_name_prefix="xtts",
+    initializer=_mark_inference_thread
+)
+
+
+def _run_inference(fn, *args, **kwargs):
+    """
+    Run a model call on the inference thread and wait for its result.
+    
+    Funnelling every XTTS call through a single thread serializes GPU work
+    (no allocator contention between requests) while request threads wait
+    with the GIL released. It also keeps torch.compile's CUDA graphs, which
+    are recorded per thread, replaying on the thread that warmed them up.
+    Calls made from the inference thread itself run directly.
+    """
+    if getattr(_INFERENCE_THREAD, "active", False):
+        return fn(*args, **kwargs)
+    return _INFERENCE_EXECUTOR.submit(fn, *args, **kwargs).result()
+
+
+# Number of released temporary output files kept for reuse per engine
+TMP_POOL_SIZE = 64
+
+# XTTS submodules wrapped with torch.compile when compilation is enabled
+# (missing ones are skipped)
+COMPILED_SUBMODULES = ("gpt", "hifigan_decoder", "text_encoder")
+
+# Sampling settings taken from the model config, as XTTS's own
+# synthesize() does, so inference() produces the same speech as tts()
+SAMPLING_SETTINGS = ("temperature", "length_penalty", "repetition_penalty", "top_k", "top_p")
+
+# Warmup inputs of increasing length (roughly 30 to 200 characters) so
+# compiled kernels and CUDA graphs are captured for typical request sizes
+_WARMUP_SENTENCE = "Olá, este é um teste de aquecimento do sintetizador."
+WARMUP_TEXTS = tuple(" ".join([_WARMUP_SENTENCE] * n) for n in (1, 2, 3, 4))
+
+
+def _conv1d_to_linear(module: torch.nn.Module) -> int:
+    """
+    Replace transformers' GPT-2 Conv1D layers with equivalent nn.Linear layers.
+    
+    Conv1D computes ``x @ weight + bias`` with a (in, out) weight, so the
+    Linear layer gets the transposed weight and produces identical output.
+    
+    Args:
+        module: Module whose children are converted recursively, in place
+    
+    Returns:
+        int: Number of layers converted
+    """
+    converted = 0
+    for name, child in module.named_children():
+        if type(child).__name__ == "Conv1D" and hasattr(child, "nf"):
+            in_features, out_features = child.weight.shape
+            linear = torch.nn.Linear(in_features, out_features)
+            linear.weight.data = child.weight.data.t().contiguous()
+            linear.bias.data = child.bias.data
+            setattr(module, name, linear)
+            converted += 1
+        else:
+            converted += _conv1d_to_linear(child)
+    return converted
+
+
+class _TracedGenerator(torch.nn.Module):
+    """
+    HiFi-GAN generator that runs a TorchScript trace.
+    
+    The trace needs a speaker embedding; calls without one go to the
+    eager generator.
+    """
+    
+    def __init__(self, traced, eager: torch.nn.Module):
+        super().__init__()
+        self.traced = traced
+        self.eager = eager
+    
+    def forward(self, x, g=None):
+        if g is None:
+            return self.eager(x)
+        return self.traced(x, g)
+
 
 class XTTSEngine(BaseTTSEngine):
     """
@@ -40,7 +170,14 @@ class XTTSEngine(BaseTTSEngine):
     multilingual text-to-speech synthesis.
     """
     
-    def __init__(self, device: str = "cpu"):
+    def __init__(
+        self,
+        device: str = "cpu",
+        precision: str = "auto",
+        compile_model: bool = False,
+        trace_vocoder: bool = False,
+        cpu_threads: int = 0
+    ):
         """
         Initialize XTTS engine.
         
@@ -48,6 +185,20 @@ class XTTSEngine(BaseTTSEngine):
             device: Compute device ('cuda', 'rocm', or 'cpu').
                    Note: Both 'cuda' and 'rocm' map to torch.device('cuda')
                    since ROCm uses the CUDA API via HIP.
+            precision: Numeric precision ('auto', 'fp32', 'fp16' or 'int8').
+                      'fp16' only applies on GPU and 'int8' only on CPU;
+                      otherwise the engine falls back to 'fp32'. 'auto'
+                      uses fp16 on GPU and fp32 on CPU.
+            compile_model: Compile the XTTS model with torch.compile when
+                          running on GPU. Ignored on CPU.
+            trace_vocoder: Replace the HiFi-GAN generator with a TorchScript
+                          trace when running on CPU. Ignored on GPU.
+            cpu_threads: Size of PyTorch's intra-op thread pool on CPU.
+                        0 keeps PyTorch's default (all cores), which suits
+                        the single inference thread. Ignored on GPU.
+        
+        Raises:
+            EngineLoadError: If the precision is not supported
         
         Note:
             Model is not loaded here. Call load_model() explicitly or
@@ -56,15 +207,73 @@ class XTTSEngine(BaseTTSEngine):
         super().__init__(device)
         self._tts_model = None
         self._torch_device = self._map_device(device)
+        self._precision = self._resolve_precision(precision)
+        self._autocast_dtype = _AUTOCAST_DTYPES.get(self._precision)
+        self._compile_model = compile_model
+        self._trace_vocoder = trace_vocoder
+        self._cpu_threads = cpu_threads
+        self._speaker_latents = None
+        # deque append/popleft are atomic, so the pool needs no lock
+        self._tmp_pool: "collections.deque[str]" = collections.deque()
         self._model_name = "tts_models/multilingual/multi-dataset/xtts_v2"
-        self._default_speaker = os.path.join(
-            os.path.dirname(__file__),
-            "..",
-            "assets",
-            "speakers",
-            "default_pt.wav"
+        self._default_speaker = DEFAULT_SPEAKER_PATH
+        self._default_speaker_ok = False
+        self._speaker_version = 0
+        self._refresh_speaker()
+    
+    def get_sample_rate(self) -> int:
+        """
+        Get the sample rate of the audio produced by XTTS v2.
+        
+        Returns:
+            int: Output sample rate in Hz (24000 for XTTS v2)
+        """
+        synthesizer = getattr(self._tts_model, "synthesizer", None)
+        return getattr(synthesizer, "output_sample_rate", None) or 24000
+    
+    def get_voice_id(self) -> str:
+        """
+        Get an identifier for the voice this engine produces.
+        
+        The reference speaker's modification time is part of the id, so
+        audio cached for a previous version of the WAV is never reused.
+        
+        Returns:
+            str: Model name, reference speaker (and its version), language
+                 and precision
+        """
+        return (
+            f"{self._model_name}|{os.path.basename(self._default_speaker)}"
+            f"@{self._speaker_version}|pt|{self._precision}"
         )
-        self._default_speaker = os.path.abspath(self._default_speaker)
+    
+    def _refresh_speaker(self) -> bool:
+        """
+        Check the reference speaker WAV and record its modification time.
+        
+        Returns:
+            bool: True if the speaker file exists and is a regular file
+        """
+        try:
+            st = os.stat(self._default_speaker)
+        except OSError:
+            self._default_speaker_ok = False
+            self._speaker_version = 0
+            return False
+        
+        self._default_speaker_ok = stat.S_ISREG(st.st_mode)
+        self._speaker_version = st.st_mtime_ns
+        return self._default_speaker_ok
+    
+    def _speaker_available(self) -> bool:
+        """
+        Check whether the reference speaker WAV is present.
+        
+        Once the file has been found it is not checked again, which keeps
+        the stat call off the request path; a missing file is re-checked
+        on every call so it can be added without a restart.
+        """
+        return self._default_speaker_ok or self._refresh_speaker()
     
     def _map_device(self, device: str) -> torch.device:
         """
@@ -90,6 +299,306 @@ class XTTSEngine(BaseTTSEngine):
         else:
             return torch.device("cpu")
     
+    def _resolve_precision(self, precision: str) -> str:
+        """
+        Validate the requested precision against the mapped device.
+        
+        Args:
+            precision: Requested precision (one of PRECISIONS)
+        
+        Returns:
+            str: Precision the engine will actually use
+        
+        Raises:
+            EngineLoadError: If the precision is not supported
+        """
+        if precision not in PRECISIONS:
+            raise EngineLoadError(
+                f"Unsupported precision: {precision} "
+                f"(must be one of {', '.join(PRECISIONS)})"
+            )
+        
+        on_gpu = self._torch_device.type == "cuda"
+        if precision == "auto":
+            return "fp16" if on_gpu else "fp32"
+        if precision in _AUTOCAST_DTYPES and not on_gpu:
+            logger.warning(f"{precision} precision requires a GPU, using fp32 on CPU")
+            return "fp32"
+        if precision == "int8" and on_gpu:
+            # Dynamic quantization kernels only exist for CPU
+            logger.warning("int8 precision is only supported on CPU, using fp32")
+            return "fp32"
+        return precision
+    
+    def _configure_backends(self) -> None:
+        """
+        Set process-wide PyTorch backend flags for GPU inference.
+        
+        - TF32 is allowed for matmuls and cuDNN convolutions (Ampere and
+          newer), which is plenty of precision for speech synthesis
+        - cuDNN autotuning stays off: XTTS sees a different sequence length
+          on almost every request, and benchmark mode would re-tune the
+          convolutions for each new shape
+        """
+        if self._torch_device.type != "cuda":
+            return
+        
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
+        torch.backends.cudnn.benchmark = False
+    
+    def _apply_precision(self) -> None:
+        """
+        Prepare the loaded model for the configured precision.
+        
+        - int8 (CPU): Linear and LSTM layers of the XTTS model are replaced
+          by dynamically quantized versions (int8 weights, float activations).
+          The GPT decoder's GPT-2 blocks use transformers' Conv1D instead of
+          nn.Linear, so those are converted to equivalent Linear layers
+          first; otherwise the slowest stage would stay in fp32.
+        - fp16 (GPU): weights stay in fp32; inference runs under FP16
+          autocast (see _inference_context())
+        
+        On CPU the intra-op thread pool is resized when cpu_threads is set.
+        By default it is left at PyTorch's default: model calls run one at a
+        time on the inference thread, so that one call may use every core.
+        """
+        if self._torch_device.type == "cpu" and self._cpu_threads > 0:
+            torch.set_num_threads(self._cpu_threads)
+        
+        if self._precision != "int8":
+            return
+        
+        # x86 selects FBGEMM or oneDNN kernels (VNNI where available)
+        if "x86" in torch.backends.quantized.supported_engines:
+            torch.backends.quantized.engine = "x86"
+        
+        xtts = self._tts_model.synthesizer.tts_model
+        converted = _conv1d_to_linear(xtts)
+        # In place: a copy of the full model would double peak memory
+        torch.ao.quantization.quantize_dynamic(
+            xtts,
+            {torch.nn.Linear, torch.nn.LSTM},
+            dtype=torch.qint8,
+            inplace=True
+        )
+        logger.info(
+            f"XTTS v2 model quantized to int8 (dynamic, "
+            f"{converted} GPT Conv1D layers converted)"
+        )
+    
+    def _compile(self) -> bool:
+        """
+        Compile the XTTS submodules listed in COMPILED_SUBMODULES on GPU.
+        
+        "reduce-overhead" mode fuses kernels and replays CUDA graphs, which
+        removes most kernel-launch overhead for short utterances; dynamic
+        shapes avoid a recompile for every new text length. The model is
+        warmed up at several input lengths so compilation happens during
+        loading rather than on the first requests. If compilation or warmup
+        fails the eager modules are restored.
+        
+        Note:
+            Autoregressive decoding goes through ``gpt.generate()``, which
+            a compiled wrapper forwards to the eager module; compiling the
+            GPT module speeds up its forward passes (latent extraction).
+            The per-token step is compiled separately by compiling
+            ``gpt.gpt_inference.forward``, which the Hugging Face sampling
+            loop calls once per token. It uses the default mode instead of
+            CUDA graphs: the key/value cache grows by one position every
+            step, so a graph would be recorded for every sequence length.
+        
+        Returns:
+            bool: True if the compiled model was warmed up
+        """
+        if not self._compile_model:
+            return False
+        
+        if self._torch_device.type != "cuda":
+            logger.info("torch.compile is only used on GPU, skipping")
+            return False
+        
+        xtts = self._tts_model.synthesizer.tts_model
+        eager_modules = {
+            name: getattr(xtts, name)
+            for name in COMPILED_SUBMODULES
+            if getattr(xtts, name, None) is not None
+        }
+        gpt_inference = getattr(eager_modules.get("gpt"), "gpt_inference", None)
+        try:
+            for name, module in eager_modules.items():
+                setattr(xtts, name, torch.compile(
+                    module,
+                    mode="reduce-overhead",
+                    fullgraph=False,
+                    dynamic=True
+                ))
+            if gpt_inference is not None:
+                # Instance attribute, so nn.Module.__call__ from generate() uses it
+                gpt_inference.forward = torch.compile(
+                    gpt_inference.forward,
+                    fullgraph=False,
+                    dynamic=True
+                )
+            self._warmup(xtts)
+            logger.info(
+                f"XTTS v2 compiled with torch.compile: {', '.join(eager_modules)}"
+            )
+            return True
+        except (TypeError, RuntimeError) as e:
+            logger.warning(
+                f"torch.compile failed, using eager model: {type(e).__name__}: {e}"
+            )
+            for name, module in eager_modules.items():
+                setattr(xtts, name, module)
+            if gpt_inference is not None:
+                gpt_inference.__dict__.pop("forward", None)
+            return False
+    
+    def _trace(self) -> None:
+        """
+        Replace the HiFi-GAN generator with an optimized TorchScript trace on CPU.
+        
+        On CPU the vocoder dominates synthesis time. A frozen trace runs
+        without Python dispatch and lets the JIT fuse the conv/activation
+        chains. Only the generator (hifigan_decoder.waveform_decoder) is
+        traced: it is made of convolutions and works for any input length,
+        while the surrounding interpolation depends on the input shape.
+        If tracing fails the eager generator is kept.
+        """
+        if not self._trace_vocoder:
+            return
+        
+        if self._torch_device.type != "cpu":
+            logger.info("TorchScript vocoder is only used on CPU, skipping")
+            return
+        
+        decoder = self._tts_model.synthesizer.tts_model.hifigan_decoder
+        eager = decoder.waveform_decoder
+        try:
+            # Example input: 1 s of latent frames and a speaker embedding
+            example_z = torch.randn(1, eager.conv_pre.in_channels, 100)
+            example_g = torch.randn(1, eager.cond_layer.in_channels, 1)
+            with torch.no_grad():
+                traced = torch.jit.trace(eager, (example_z, example_g), check_trace=False)
+                traced = torch.jit.optimize_for_inference(traced)
+                # The first runs install the optimized graph
+                for _ in range(3):
+                    traced(example_z, example_g)
+        except (AttributeError, TypeError, RuntimeError) as e:
+            logger.warning(
+                f"TorchScript tracing failed, using eager vocoder: {type(e).__name__}: {e}"
+            )
+            return
+        
+        decoder.waveform_decoder = _TracedGenerator(traced, eager)
+        logger.info("XTTS v2 vocoder traced with TorchScript")
+    
+    def _warmup(self, xtts, texts=WARMUP_TEXTS) -> None:
+        """
+        Run the model once for each warmup text.
+        
+        Args:
+            xtts: Loaded XTTS model (synthesizer.tts_model)
+            texts: Texts to synthesize (defaults to WARMUP_TEXTS)
+        """
+        if not self._speaker_available():
+            logger.warning("Default speaker file not found, skipping warmup")
+            return
+        
+        gpt_cond_latent, speaker_embedding = self._get_speaker_latents()
+        settings = self._sampling_settings()
+        with self._inference_context():
+            for text in texts:
+                xtts.inference(text, "pt", gpt_cond_latent, speaker_embedding, **settings)
+    
+    def _warmup_once(self) -> None:
+        """
+        Run one short synthesis right after loading.
+        
+        The first inference grows the CUDA caching allocator's pool and
+        creates cuDNN/oneDNN primitives; doing it here keeps that cost out
+        of the first real request. Failures are logged and ignored, since
+        the model itself loaded fine. On CUDA the device is synchronized
+        afterwards, so no warmup kernels are still queued when the first
+        request starts.
+        """
+        try:
+            self._warmup(self._tts_model.synthesizer.tts_model, WARMUP_TEXTS[:1])
+            if self._torch_device.type == "cuda":
+                torch.cuda.synchronize()
+        except Exception as e:
+            logger.warning(f"XTTS v2 warmup failed: {type(e).__name__}: {e}")
+    
+    def _get_xtts(self):
+        """
+        Get the underlying XTTS model (synthesizer.tts_model).
+        
+        Raises:
+            SynthesisError: If the loaded model is not an XTTS model
+        """
+        synthesizer = getattr(self._tts_model, "synthesizer", None)
+        xtts = getattr(synthesizer, "tts_model", None)
+        if xtts is None or not hasattr(xtts, "get_conditioning_latents"):
+            raise SynthesisError("Loaded model does not expose the XTTS inference API")
+        return xtts
+    
+    def _get_speaker_latents(self):
+        """
+        Get the conditioning latents of the default speaker.
+        
+        The reference WAV is read and encoded once per engine; every
+        synthesis afterwards reuses the result instead of running the
+        speaker encoder again. Conditioning lengths come from the model
+        config, like XTTS's own full_inference().
+        
+        Returns:
+            tuple: (gpt_cond_latent, speaker_embedding)
+        """
+        if self._speaker_latents is None:
+            # The voice id must describe the file the latents come from
+            self._refresh_speaker()
+            xtts = self._get_xtts()
+            config = xtts.config
+            with self._inference_context():
+                self._speaker_latents = xtts.get_conditioning_latents(
+                    audio_path=[self._default_speaker],
+                    gpt_cond_len=config.gpt_cond_len,
+                    gpt_cond_chunk_len=config.gpt_cond_chunk_len,
+                    max_ref_length=config.max_ref_len,
+                    sound_norm_refs=config.sound_norm_refs,
+                )
+            logger.debug(f"Speaker latents computed for {self._default_speaker}")
+        return self._speaker_latents
+    
+    def _sampling_settings(self) -> dict:
+        """
+        Get the sampling settings of the model config (see SAMPLING_SETTINGS).
+        """
+        config = self._get_xtts().config
+        return {
+            name: getattr(config, name)
+            for name in SAMPLING_SETTINGS
+            if hasattr(config, name)
+        }
+    
+    @contextlib.contextmanager
+    def _inference_context(self) -> Iterator[None]:
+        """
+        Context that model calls must run under.
+        
+        Autograd is disabled with torch.inference_mode() (no graph
+        bookkeeping or version counters), and on GPU with a reduced
+        precision matmuls and convolutions run under FP16 autocast,
+        halving activation traffic and using tensor cores.
+        """
+        with torch.inference_mode():
+            if self._autocast_dtype is None:
+                yield
+            else:
+                with torch.autocast(device_type="cuda", dtype=self._autocast_dtype):
+                    yield
+    
     def load_model(self, model_path: Optional[str] = None) -> None:
         """
         Load the XTTS v2 model into memory.
@@ -104,20 +613,72 @@ class XTTSEngine(BaseTTSEngine):
         
         Raises:
             EngineLoadError: If model loading fails
+        
+        Note:
+            Loaded models are cached per process. Engines with the same
+            model, device, precision and compile/trace settings share one model
+            instead of loading the checkpoint (and its GPU memory) again.
+            The default speaker's conditioning latents are computed here
+            as well. Loading runs on the inference thread.
         """
         if self._model_loaded:
             logger.debug("Model already loaded, skipping")
             return
         
+        _run_inference(self._load_model)
+    
+    def _load_model(self) -> None:
+        """
+        Body of load_model(), run on the inference thread.
+        """
+        device_str = str(self._torch_device)
+        key = (
+            self._model_name,
+            device_str,
+            self._precision,
+            self._compile_model,
+            self._trace_vocoder,
+        )
+        
+        with _MODEL_CACHE_LOCK:
+            cached = _MODEL_CACHE.get(key)
+            if cached is not None:
+                logger.debug(f"Reusing loaded XTTS v2 model on {device_str}")
+                self._tts_model = cached
+                self._model_loaded = True
+            else:
+                self._load_uncached(device_str)
+                _MODEL_CACHE[key] = self._tts_model
+        
+        # Encode the reference speaker up front so requests don't pay for it
+        if self._speaker_available():
+            try:
+                self._get_speaker_latents()
+            except Exception as e:
+                raise EngineLoadError(
+                    f"Failed to encode speaker reference {self._default_speaker}: "
+                    f"{type(e).__name__}: {e}"
+                ) from e
+    
+    def _load_uncached(self, device_str: str) -> None:
+        """
+        Load and prepare a new model instance. Called with _MODEL_CACHE_LOCK held.
+        
+        Args:
+            device_str: Torch device the model is placed on
+        
+        Raises:
+            EngineLoadError: If model loading fails
+        """
+        if TTS is None:
+            raise self._import_error(_TTS_IMPORT_ERROR) from _TTS_IMPORT_ERROR
+        
         try:
-            from TTS.api import TTS
-            
             logger.info(f"Loading XTTS v2 model on device: {self._torch_device}")
             logger.info("This may take a few minutes on first run (model download)...")
             
             # Initialize TTS with XTTS v2 model and device placement
             # XTTS v2 requires device to be specified during initialization
-            device_str = str(self._torch_device)
             self._tts_model = TTS(
                 model_name=self._model_name,
                 progress_bar=True,
@@ -129,20 +690,21 @@ class XTTSEngine(BaseTTSEngine):
             if hasattr(self._tts_model, 'synthesizer') and hasattr(self._tts_model.synthesizer, 'to'):
                 self._tts_model.synthesizer.to(device_str)
             
+            self._configure_backends()
+            self._apply_precision()
+            warmed = self._compile()
+            self._trace()
+            if not warmed:
+                self._warmup_once()
+            
             self._model_loaded = True
-            logger.info(f"XTTS v2 model loaded successfully on {self._torch_device}")
+            logger.info(
+                f"XTTS v2 model loaded successfully on {self._torch_device} "
+                f"({self._precision})"
+            )
             
         except ImportError as e:
-            # Só é erro de instalação se o próprio módulo TTS não existir
-            if e.name == "TTS" or e.name.startswith("TTS."):
-                raise EngineLoadError(
-                    "Coqui TTS library not installed. Install with: pip install TTS"
-                ) from e
-
-            # Qualquer outro ImportError é erro REAL do XTTS
-            raise EngineLoadError(
-                f"XTTS internal ImportError: {type(e).__name__}: {e}"
-            ) from e
+            raise self._import_error(e) from e
 
         except Exception as e:
             # All other exceptions are runtime errors during model loading
@@ -151,6 +713,28 @@ class XTTSEngine(BaseTTSEngine):
                 f"Failed to load XTTS v2 model: {type(e).__name__}: {e}"
             ) from e
     
+    def _import_error(self, e: ImportError) -> EngineLoadError:
+        """
+        Translate an ImportError raised while loading XTTS.
+        
+        Args:
+            e: The ImportError
+        
+        Returns:
+            EngineLoadError: Error to raise from load_model()
+        """
+        # Só é erro de instalação se o próprio módulo TTS não existir
+        name = e.name or ""
+        if name == "TTS" or name.startswith("TTS."):
+            return EngineLoadError(
+                "Coqui TTS library not installed. Install with: pip install TTS"
+            )
+
+        # Qualquer outro ImportError é erro REAL do XTTS
+        return EngineLoadError(
+            f"XTTS internal ImportError: {type(e).__name__}: {e}"
+        )
+    
     def synthesize(
         self,
         text: str,
@@ -175,18 +759,14 @@ class XTTSEngine(BaseTTSEngine):
         # 3. Resolve output path (AFTER model is confirmed loaded)
         # This ensures we don't create empty files if model loading fails
         if output_path is None:
-            fd, output_path = tempfile.mkstemp(suffix=".wav", prefix="xtts_")
-            os.close(fd)
+            output_path = self._acquire_tmp_path()
         else:
-            output_dir = os.path.dirname(os.path.abspath(output_path))
-            if output_dir:
-                os.makedirs(output_dir, exist_ok=True)
-            output_path = os.path.abspath(output_path)
+            output_path = resolve_output_path(output_path)
 
         # 4. Resolve default speaker (use the one defined in __init__)
         default_speaker = self._default_speaker
 
-        if not os.path.exists(default_speaker):
+        if not self._speaker_available():
             raise SynthesisError(
                 f"Default speaker file not found: {default_speaker}. "
                 "XTTS v2 requires a reference speaker WAV."
@@ -200,14 +780,14 @@ class XTTSEngine(BaseTTSEngine):
 
         try:
             # 5. Perform XTTS v2 synthesis
-            # IMPORTANT: XTTS must use tts_to_file with speaker_wav
+            # IMPORTANT: XTTS must be conditioned on the speaker reference;
+            # its latents are cached, so XTTS's inference() is called
+            # directly instead of tts(), which would re-encode the WAV.
+            # The waveform stays in memory and is written once by write_audio
             try:
-                self._tts_model.tts_to_file(
-                    text=text,
-                    speaker_wav=default_speaker,
-                    language="pt",
-                    file_path=output_path,
-                )
+                wav = _run_inference(self._infer, text)
+            except SynthesisError:
+                raise
             except Exception as tts_error:
                 # Preserve the original XTTS runtime error with full context
                 # This could be: invalid speaker_wav, language mismatch, audio backend failure, etc.
@@ -238,11 +818,24 @@ class XTTSEngine(BaseTTSEngine):
                         f"XTTS synthesis failed: {error_type}: {error_msg}"
                     ) from tts_error
 
-            # 6. Validate output file
-            if not os.path.exists(output_path):
+            # 6. Write WAV file
+            try:
+                self.write_audio(
+                    np.asarray(wav, dtype=np.float32).reshape(-1),
+                    output_path,
+                    sample_rate=self.get_sample_rate()
+                )
+            except AudioWriteError as e:
+                raise SynthesisError(
+                    f"Failed to write synthesized audio: {e}"
+                ) from e
+
+            # 7. Validate output file (a single stat for existence and size)
+            try:
+                file_size = os.stat(output_path).st_size
+            except FileNotFoundError:
                 raise SynthesisError(f"Audio file was not created: {output_path}")
 
-            file_size = os.path.getsize(output_path)
             if file_size == 0:
                 raise SynthesisError(
                     f"Generated audio file is empty: {output_path}. "
@@ -285,4 +878,152 @@ class XTTSEngine(BaseTTSEngine):
             raise SynthesisError(
                 f"Unexpected error during XTTS synthesis: {type(e).__name__}: {e}"
             ) from e
-
+    
+    def _infer(self, text: str):
+        """
+        Run XTTS inference for one text. Called on the inference thread.
+        
+        Returns:
+            np.ndarray: Float waveform at get_sample_rate() Hz
+        """
+        xtts = self._get_xtts()
+        gpt_cond_latent, speaker_embedding = self._get_speaker_latents()
+        with self._inference_context():
+            return xtts.inference(
+                text,
+                "pt",
+                gpt_cond_latent,
+                speaker_embedding,
+                enable_text_splitting=True,
+                **self._sampling_settings()
+            )["wav"]
+    
+    def _next_stream_chunk(self, chunks) -> Optional[bytes]:
+        """
+        Advance an inference_stream() generator by one chunk.
+        
+        Called on the inference thread. Autocast and inference mode are
+        thread-local, so they are entered around each step rather than
+        held across yields.
+        
+        Returns:
+            bytes: 16-bit little-endian PCM, or None when the stream is done
+        """
+        with self._inference_context():
+            chunk = next(chunks, None)
+            if chunk is None:
+                return None
+            # Convert to 16-bit PCM on the device, then copy half the bytes back;
+            # scaled in float32 since fp16 autocast output can't hold 32767
+            pcm = (chunk.float().clamp(-1.0, 1.0) * 32767.0).to(torch.int16)
+        return pcm.cpu().numpy().astype("<i2", copy=False).tobytes()
+    
+    def _acquire_tmp_path(self) -> str:
+        """
+        Get a temporary output file, reusing a released one when possible.
+        
+        Pooled files are only reused while they are still regular files
+        (not replaced by a symlink); otherwise a new one is created with
+        mkstemp.
+        
+        Returns:
+            str: Absolute path to an existing, empty temporary file
+        """
+        while True:
+            try:
+                path = self._tmp_pool.popleft()
+            except IndexError:
+                break
+            try:
+                st = os.lstat(path)
+            except OSError:
+                continue
+            if stat.S_ISREG(st.st_mode):
+                return path
+        
+        fd, path = tempfile.mkstemp(suffix=".wav", prefix="xtts_")
+        os.close(fd)
+        return path
+    
+    def release_tmp_path(self, path: str) -> None:
+        """
+        Hand a temporary file from synthesize() back for reuse.
+        
+        Call this once the audio returned by synthesize(output_path=None)
+        is no longer needed. The file is truncated and kept for the next
+        call instead of being deleted; if the pool is full it is removed.
+        
+        Args:
+            path: Path returned by synthesize(text) without an output path
+        """
+        try:
+            if len(self._tmp_pool) >= TMP_POOL_SIZE:
+                os.remove(path)
+                return
+            os.truncate(path, 0)
+        except OSError:
+            return
+        self._tmp_pool.append(path)
+    
+    def synthesize_stream(
+        self,
+        text: str,
+        chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """
+        Synthesize speech with XTTS v2 and yield PCM chunks as they are generated.
+        
+        Uses the model's inference_stream() generator, so the first chunk is
+        available long before the whole utterance has been synthesized.
+        
+        Args:
+            text: Input text to synthesize
+            chunk_size: Number of GPT tokens decoded into each chunk
+        
+        Yields:
+            bytes: 16-bit little-endian mono PCM at get_sample_rate() Hz
+        
+        Raises:
+            SynthesisError: If streaming synthesis fails
+            EngineLoadError: If the model cannot be loaded
+        """
+        self.validate_text(text)
+        
+        if not self._model_loaded:
+            self.load_model()
+        
+        xtts = self._get_xtts()
+        if not hasattr(xtts, "inference_stream"):
+            raise SynthesisError("Loaded model does not support streaming inference")
+        
+        default_speaker = self._default_speaker
+        if not self._speaker_available():
+            raise SynthesisError(
+                f"Default speaker file not found: {default_speaker}. "
+                "XTTS v2 requires a reference speaker WAV."
+            )
+        
+        logger.debug(f"Streaming synthesis with XTTS v2 on {self._torch_device}")
+        
+        try:
+            gpt_cond_latent, speaker_embedding = _run_inference(self._get_speaker_latents)
+            chunks = xtts.inference_stream(
+                text,
+                "pt",
+                gpt_cond_latent,
+                speaker_embedding,
+                stream_chunk_size=chunk_size,
+                enable_text_splitting=True,
+                **self._sampling_settings()
+            )
+            while True:
+                pcm = _run_inference(self._next_stream_chunk, chunks)
+                if pcm is None:
+                    break
+                yield pcm
+        except SynthesisError:
+            raise
+        except Exception as e:
+            raise SynthesisError(
+                f"XTTS streaming synthesis failed: {type(e).__name__}: {e}"
+            ) from e
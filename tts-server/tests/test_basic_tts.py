@@ -7,6 +7,9 @@ audio file generation. It is designed to:
 - Verify device detection works correctly
 - Validate engine manager initialization
 - Test the synthesis workflow
+- Test the batched synthesis workflow
+- Test the streaming synthesis workflow
+- Test concurrent asynchronous requests
 - Confirm audio file generation
 
 The test is runnable as a standalone script:
@@ -27,28 +30,74 @@ It DOES require:
 - File system write access
 """
 
+import asyncio
 import os
+import struct
 import sys
+import tempfile
+import time
+import tracemalloc
+import wave
 from pathlib import Path
 
+import pytest
+
 # Add parent directory to path to allow imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import config
 from core.device import detect_device, DeviceInfo
 from core.engine_manager import EngineManager
 from core.errors import TTSError
 
+# Batch sizes exercised by the batched pipeline test
+BATCH_SIZES = [1, 4, 8]
+
+# EngineManager() must stay lazy: no device detection or model loading
+MAX_CONSTRUCT_SECONDS = 5e-3
+MAX_CONSTRUCT_BYTES = 16 * 1024
+
+# Streaming budgets, overridable for slower machines (e.g. CPU-only runs)
+FIRST_CHUNK_MS = float(os.getenv("TTS_TEST_FIRST_CHUNK_MS", "250"))
+MAX_STREAM_RTF = float(os.getenv("TTS_TEST_MAX_STREAM_RTF", "1.0"))
+
+# Sentence of similar length to the main test text, timed after it
+SECOND_TEST_TEXT = "Olá, esta é a segunda frase do teste de síntese de fala."
+
+# Number of concurrent requests issued by the concurrency test
+CONCURRENT_REQUESTS = 4
+
+# Size of the canonical WAV header written by audio.writer
+WAV_HEADER_SIZE = 44
+
+# Shortest audio accepted for the test sentences, in seconds
+MIN_AUDIO_SECONDS = 0.5
 
-def test_basic_tts_pipeline():
+
+@pytest.fixture(autouse=True)
+def clear_device_cache():
+    """
+    Forget the cached device after each test so tests stay independent.
+    """
+    yield
+    detect_device.cache_clear()
+
+
+def test_basic_tts_pipeline(tmp_path):
     """
     Test the complete TTS pipeline end-to-end.
     
     This function performs:
     1. Device detection
-    2. Engine manager initialization
-    3. Text synthesis
+    2. Engine manager initialization (construction must be lazy)
+    3. Engine warmup, then two timed syntheses; warmup plus the first one
+       is the time-to-first-byte (TTFB) of a fresh server
     4. Audio file verification
     
+    Args:
+        tmp_path: Fresh directory (pytest fixture) used as the output and
+                  cache directory, so both timed calls are real syntheses
+    
     Raises:
         AssertionError: If any step fails
         TTSError: If TTS processing fails
@@ -82,17 +131,41 @@ def test_basic_tts_pipeline():
     # Step 2: Engine Manager Initialization
     print("Step 2: Initializing engine manager...")
     try:
-        manager = EngineManager()
-        print("  ✓ Engine manager created")
+        tracemalloc.start()
+        try:
+            t0 = time.perf_counter()
+            manager = EngineManager()
+            t_construct = time.perf_counter() - t0
+            construct_bytes = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        print(f"  ✓ Engine manager created in {t_construct * 1000:.3f} ms ({construct_bytes} bytes)")
+        
+        if t_construct >= MAX_CONSTRUCT_SECONDS:
+            raise AssertionError(
+                f"EngineManager() took {t_construct * 1000:.1f} ms (expected < "
+                f"{MAX_CONSTRUCT_SECONDS * 1000:.0f} ms); is it loading the engine eagerly?"
+            )
+        if construct_bytes >= MAX_CONSTRUCT_BYTES:
+            raise AssertionError(
+                f"EngineManager() allocated {construct_bytes} bytes "
+                f"(expected < {MAX_CONSTRUCT_BYTES})"
+            )
+        if manager.is_initialized():
+            raise AssertionError("EngineManager() initialized the engine eagerly")
         
-        # Get device info (triggers detection if not already done)
+        # Get device info (served from the detection cache filled in Step 1)
         current_device = manager.get_device_info()
         print(f"  ✓ Device info retrieved: {current_device.name} ({current_device.type})")
         
-        # Initialize engine (lazy initialization)
-        engine = manager.get_engine()
-        print(f"  ✓ Engine initialized: {type(engine).__name__}")
-        print(f"  ✓ Engine device: {engine.get_device()}")
+        if current_device is not device_info:
+            raise AssertionError("EngineManager re-detected the device instead of using the cache")
+        
+        # Best of several calls, so a single scheduler hiccup doesn't fail the test
+        lookup_ns = min(_time_ns(manager.get_device_info) for _ in range(5))
+        print(f"  ✓ Cached device lookup: {lookup_ns} ns")
+        if lookup_ns >= 1000:
+            raise AssertionError(f"Cached device lookup took {lookup_ns} ns (expected < 1 µs)")
         
     except Exception as e:
         print(f"  ✗ Engine manager initialization failed: {e}")
@@ -106,16 +179,41 @@ def test_basic_tts_pipeline():
         print(f"  → Input text: {test_text}")
         print(f"  → Device: {device_info.type}")
         
-        # Create output directory in tests directory
-        test_output_dir = Path(__file__).parent / "output"
-        test_output_dir.mkdir(exist_ok=True)
+        output_dir = str(tmp_path)
+        
+        # Load and warm up the engine outside the timed syntheses
+        t0 = time.perf_counter()
+        engine = manager.get_engine()
+        warmup_ms = (time.perf_counter() - t0) * 1000
+        print(f"  ✓ Engine initialized: {type(engine).__name__}")
+        print(f"  ✓ Engine device: {engine.get_device()}")
+        print(f"  ✓ Warmup (model load): {warmup_ms:.1f} ms")
         
+        t1 = time.perf_counter()
         audio_path = manager.synthesize(
             text=test_text,
-            output_dir=str(test_output_dir)
+            output_dir=output_dir
+        )
+        t_synth_first_call = time.perf_counter() - t1
+        
+        t2 = time.perf_counter()
+        manager.synthesize(
+            text=SECOND_TEST_TEXT,
+            output_dir=output_dir
         )
+        t_synth_second_call = time.perf_counter() - t2
         
         print(f"  ✓ Synthesis completed")
+        print(f"  ✓ First synthesis: {t_synth_first_call * 1000:.1f} ms")
+        print(f"  ✓ Second synthesis: {t_synth_second_call * 1000:.1f} ms")
+        print(f"  ✓ TTFB on a fresh server: {warmup_ms + t_synth_first_call * 1000:.1f} ms")
+        
+        # A cold first call means one-time setup leaked past the warmup
+        if t_synth_second_call >= t_synth_first_call * 1.2:
+            raise AssertionError(
+                f"Second synthesis ({t_synth_second_call * 1000:.1f} ms) slower than "
+                f"1.2x the first ({t_synth_first_call * 1000:.1f} ms)"
+            )
         print(f"  ✓ Audio file path: {audio_path}")
         
     except Exception as e:
@@ -127,10 +225,13 @@ def test_basic_tts_pipeline():
     # Step 4: Audio File Verification
     print("Step 4: Verifying audio file...")
     try:
-        if not os.path.exists(audio_path):
+        # A single stat serves both the existence and the size check
+        try:
+            file_size = os.stat(audio_path).st_size
+        except FileNotFoundError:
             raise AssertionError(f"Audio file does not exist: {audio_path}")
         
-        file_size = os.path.getsize(audio_path)
+        abs_path = os.path.abspath(audio_path)
         print(f"  ✓ File exists: {audio_path}")
         print(f"  ✓ File size: {file_size} bytes")
         
@@ -139,11 +240,24 @@ def test_basic_tts_pipeline():
         else:
             print("  ✓ File contains data")
         
-        # Verify it's a WAV file (check extension)
-        if not audio_path.endswith('.wav'):
-            print("  ⚠ Warning: File does not have .wav extension")
-        else:
-            print("  ✓ File has .wav extension")
+        # Verify it's a WAV file holding real audio (parse the RIFF header)
+        if file_size > 0:
+            sample_rate, channels, bits_per_sample, data_size = _validate_wav(audio_path)
+            bytes_per_frame = channels * bits_per_sample // 8
+            duration = data_size / (sample_rate * bytes_per_frame)
+            print(f"  ✓ WAV header: {sample_rate} Hz, {channels} channel(s), {bits_per_sample}-bit")
+            print(f"  ✓ Audio duration: {duration:.2f} s")
+            
+            if data_size != file_size - WAV_HEADER_SIZE:
+                raise AssertionError(
+                    f"WAV data size {data_size} does not match the file "
+                    f"({file_size - WAV_HEADER_SIZE} bytes after the header)"
+                )
+            # Placeholder engines may write a header without samples
+            if file_size > WAV_HEADER_SIZE and data_size < sample_rate * MIN_AUDIO_SECONDS * bytes_per_frame:
+                raise AssertionError(
+                    f"Audio is only {duration:.2f} s long (expected >= {MIN_AUDIO_SECONDS} s)"
+                )
         
     except Exception as e:
         print(f"  ✗ File verification failed: {e}")
@@ -154,13 +268,245 @@ def test_basic_tts_pipeline():
     print("Test Summary")
     print("=" * 70)
     print(f"Device used: {device_info.type.upper()} ({device_info.name})")
-    print(f"Audio file: {os.path.abspath(audio_path)}")
-    print(f"File size: {os.path.getsize(audio_path)} bytes")
+    print(f"Audio file: {abs_path}")
+    print(f"File size: {file_size} bytes")
     print()
     print("✓ All steps completed successfully!")
     print("=" * 70)
+
+
+def _validate_wav(path) -> tuple:
+    """
+    Parse and check the canonical 44-byte header of a PCM WAV file.
+    
+    Args:
+        path: Path to the WAV file
+    
+    Returns:
+        tuple: (sample_rate, num_channels, bits_per_sample, data_size)
+    
+    Raises:
+        AssertionError: If the header is not a RIFF/WAVE PCM header
+    """
+    with open(path, 'rb') as f:
+        hdr = f.read(WAV_HEADER_SIZE)
+    
+    if len(hdr) < WAV_HEADER_SIZE:
+        raise AssertionError(f"WAV header truncated: {len(hdr)} bytes in {path}")
+    
+    (magic, riff_size, wave_id, fmt, fmt_len, fmt_tag, num_channels, sample_rate,
+     byte_rate, block_align, bits_per_sample, data, data_size) = struct.unpack(
+        '<4sI4s4sIHHIIHH4sI', hdr
+    )
+    
+    assert magic == b'RIFF' and wave_id == b'WAVE', f"Not a RIFF/WAVE file: {path}"
+    assert fmt == b'fmt ' and data == b'data', f"Unexpected WAV chunk layout: {path}"
+    assert fmt_tag == 1, f"WAV file is not PCM (format tag {fmt_tag}): {path}"
+    assert sample_rate > 0 and num_channels > 0, f"Invalid WAV format fields: {path}"
+    
+    return sample_rate, num_channels, bits_per_sample, data_size
+
+
+def _run_in_tmp_dir(test, *args):
+    """
+    Call a test with a temporary directory standing in for pytest's tmp_path.
     
-    return audio_path
+    The directory and everything the test wrote to it are removed afterwards.
+    """
+    with tempfile.TemporaryDirectory(prefix="tts_test_") as tmp_dir:
+        test(*args, Path(tmp_dir))
+
+
+def _time_ns(fn) -> int:
+    """
+    Return how long a single call of fn takes, in nanoseconds.
+    """
+    t0 = time.perf_counter_ns()
+    fn()
+    return time.perf_counter_ns() - t0
+
+
+@pytest.mark.parametrize("batch_size", BATCH_SIZES)
+def test_batched_tts_pipeline(batch_size, tmp_path):
+    """
+    Test synthesis of several texts through EngineManager.synthesize_batch().
+    
+    Each text is distinct, so every item really goes through the engine
+    instead of being coalesced with an identical one. The total and
+    per-item wall time are reported so batch sizes can be compared.
+    
+    Args:
+        batch_size: Number of texts synthesized in one call
+        tmp_path: Fresh directory (pytest fixture) used as the cache
+                  directory, so every run measures synthesis, not cache hits
+    
+    Raises:
+        AssertionError: If any item is missing or empty
+        TTSError: If TTS processing fails
+    """
+    print("=" * 70)
+    print(f"TTS Batched Pipeline Test (batch size {batch_size})")
+    print("=" * 70)
+    
+    texts = [
+        f"Olá, este é um teste de conversão de texto para fala, frase {i + 1} de {batch_size}."
+        for i in range(batch_size)
+    ]
+    
+    manager = EngineManager()
+    
+    t0 = time.perf_counter()
+    audio_paths = manager.synthesize_batch(texts, output_dir=str(tmp_path))
+    t_total = time.perf_counter() - t0
+    
+    assert len(audio_paths) == batch_size, (
+        f"Expected {batch_size} audio files, got {len(audio_paths)}"
+    )
+    assert len(set(audio_paths)) == batch_size, "Distinct texts produced the same file"
+    
+    for audio_path in audio_paths:
+        if not os.path.exists(audio_path):
+            raise AssertionError(f"Audio file does not exist: {audio_path}")
+        if os.path.getsize(audio_path) == 0:
+            raise AssertionError(f"Audio file is empty: {audio_path}")
+    
+    print(f"  ✓ {batch_size} audio files generated")
+    print(f"  ✓ Total time: {t_total * 1000:.1f} ms")
+    print(f"  ✓ Time per item: {t_total / batch_size * 1000:.1f} ms")
+    print("=" * 70)
+
+
+def test_streaming_tts_pipeline(tmp_path):
+    """
+    Test chunked synthesis through EngineManager.synthesize_stream().
+    
+    The model is loaded before timing, so the time to the first chunk
+    measures streaming latency rather than the one-off engine load. The
+    first chunk must arrive within FIRST_CHUNK_MS, and the stream as a whole
+    must be generated at least as fast as it plays back (RTF <= MAX_STREAM_RTF).
+    
+    Args:
+        tmp_path: Fresh directory (pytest fixture) receiving the streamed
+                  WAV file and the cache entry
+    
+    Raises:
+        AssertionError: If the stream is too slow or produces no audio
+        TTSError: If TTS processing fails
+    """
+    print("=" * 70)
+    print("TTS Streaming Pipeline Test")
+    print("=" * 70)
+    
+    test_text = "Olá, este é um teste de síntese de fala em streaming."
+    
+    stream_path = tmp_path / "stream_test.wav"
+    
+    manager = EngineManager()
+    # Loads and warms up the model before anything is timed
+    engine = manager.get_engine()
+    sample_rate = engine.get_sample_rate()
+    
+    chunks = manager.synthesize_stream(test_text, output_dir=str(tmp_path))
+    
+    t0 = time.perf_counter()
+    first = next(chunks)
+    ttfb = time.perf_counter() - t0
+    
+    # The first chunk carries the WAV header ahead of the first PCM block
+    assert first[:4] == b"RIFF", "Stream does not start with a WAV header"
+    
+    n_chunks = 1
+    with wave.open(str(stream_path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(first[WAV_HEADER_SIZE:])
+        for chunk in chunks:
+            wav_file.writeframes(chunk)
+            n_chunks += 1
+        n_frames = wav_file.getnframes()
+    t_total = time.perf_counter() - t0
+    
+    audio_seconds = n_frames / sample_rate
+    assert audio_seconds > 0, "Stream produced no audio"
+    rtf = t_total / audio_seconds
+    
+    print(f"  ✓ First chunk: {ttfb * 1000:.1f} ms (budget {FIRST_CHUNK_MS:.0f} ms)")
+    print(f"  ✓ {n_chunks} chunks, {audio_seconds:.2f} s of audio in {t_total:.2f} s")
+    print(f"  ✓ RTF: {rtf:.3f}")
+    print(f"  ✓ Audio file: {stream_path}")
+    print("=" * 70)
+    
+    assert ttfb * 1000 < FIRST_CHUNK_MS, (
+        f"First chunk took {ttfb * 1000:.1f} ms (expected < {FIRST_CHUNK_MS:.0f} ms)"
+    )
+    assert rtf <= MAX_STREAM_RTF, (
+        f"Streaming RTF {rtf:.3f} exceeds {MAX_STREAM_RTF} (slower than real time)"
+    )
+
+
+def test_concurrent_tts(tmp_path):
+    """
+    Test concurrent requests through EngineManager.asynthesize().
+    
+    Requests are issued with asyncio.gather() while the batch worker runs,
+    as they are on the API server. Identical concurrent requests must share
+    one synthesis, so together they should take far less than the same
+    number of sequential syntheses.
+    
+    Args:
+        tmp_path: Fresh directory (pytest fixture) used as the cache
+                  directory, so earlier runs can't turn requests into hits
+    
+    Raises:
+        AssertionError: If the requests were serialized or disagree
+        TTSError: If TTS processing fails
+    """
+    print("=" * 70)
+    print(f"TTS Concurrency Test ({CONCURRENT_REQUESTS} requests)")
+    print("=" * 70)
+    
+    # Different texts, so neither result is served from the other's cache
+    reference_text = "Olá, esta frase mede o tempo de uma síntese isolada."
+    test_text = "Olá, este é um teste de pedidos simultâneos de síntese de fala."
+    
+    output_dir = str(tmp_path)
+    
+    manager = EngineManager()
+    manager.get_engine()  # loads and warms up the model
+    
+    async def run():
+        await manager.start_batching(
+            slots=asyncio.Semaphore(config.TTS_CONCURRENT_REQUESTS)
+        )
+        try:
+            t0 = time.perf_counter()
+            await manager.asynthesize(reference_text, output_dir)
+            single_time = time.perf_counter() - t0
+            
+            t0 = time.perf_counter()
+            paths = await asyncio.gather(*[
+                manager.asynthesize(text, output_dir)
+                for text in [test_text] * CONCURRENT_REQUESTS
+            ])
+            wall_time = time.perf_counter() - t0
+        finally:
+            await manager.stop_batching()
+        return single_time, wall_time, paths
+    
+    single_time, wall_time, audio_paths = asyncio.run(run())
+    
+    print(f"  ✓ Single request: {single_time * 1000:.1f} ms")
+    print(f"  ✓ {CONCURRENT_REQUESTS} concurrent requests: {wall_time * 1000:.1f} ms")
+    print("=" * 70)
+    
+    assert len(set(audio_paths)) == 1, "Identical requests produced different files"
+    if os.stat(audio_paths[0]).st_size == 0:
+        raise AssertionError(f"Audio file is empty: {audio_paths[0]}")
+    assert wall_time < CONCURRENT_REQUESTS * single_time * 0.7, (
+        f"{CONCURRENT_REQUESTS} concurrent requests took {wall_time * 1000:.1f} ms; "
+        f"a single one takes {single_time * 1000:.1f} ms (serialized?)"
+    )
 
 
 if __name__ == "__main__":
@@ -171,7 +517,14 @@ if __name__ == "__main__":
         python test_basic_tts.py
     """
     try:
-        audio_path = test_basic_tts_pipeline()
+        _run_in_tmp_dir(test_basic_tts_pipeline)
+        for batch_size in BATCH_SIZES:
+            print()
+            _run_in_tmp_dir(test_batched_tts_pipeline, batch_size)
+        print()
+        _run_in_tmp_dir(test_streaming_tts_pipeline)
+        print()
+        _run_in_tmp_dir(test_concurrent_tts)
         print()
         print("Test PASSED")
         sys.exit(0)